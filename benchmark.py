@@ -0,0 +1,245 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+import mockserver
+from kbhughscrap import playertext, statcroling
+from kbhughscrap.tracing import reset_traces
+from kbhughscrap.waitengine import latency_report
+
+# 기본 측정 규모 (선수 수)
+DEFAULT_SCALES = (10, 100, 1000)
+
+# 수집 방식별 함수 (player_list, base_url) -> {'이름_학교': html}
+FETCH_MODES = {
+    'http': 'recordfetch.fetch_player_stats',
+    'selenium': 'statcroling.scrape_player_stats (드롭다운)',
+    'selenium-index': 'statcroling.scrape_player_stats (인덱스 적중)',
+    'parallel': 'statcroling.scrape_player_stats_parallel',
+}
+
+
+# --- 1. 측정 도구 ---
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(target, scale, run, latencies=None, track_memory=True):
+    """
+    run()을 한 번 실행하며 처리량, 선수별 지연 시간(p50/p95), 최대 메모리를 측정합니다.
+    run 안의 print 출력은 버립니다.
+
+    Args:
+        target (str): 측정 대상 이름.
+        scale (int): 선수 수.
+        run (callable): 측정할 작업. 성공한 선수 수를 반환.
+        latencies (callable): run 이후 선수별 지연 시간(초) 리스트를 반환하는 함수.
+        track_memory (bool): tracemalloc으로 최대 메모리를 잴지 여부 (켜면 느려짐).
+    """
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        succeeded = run()
+    elapsed = time.perf_counter() - start
+    peak = None
+    if track_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    values = sorted(latencies()) if latencies else []
+    return {
+        'target': target,
+        'scale': scale,
+        'succeeded': succeeded,
+        'seconds': elapsed,
+        'players_per_minute': scale / elapsed * 60 if elapsed else None,
+        'p50': _percentile(values, 50),
+        'p95': _percentile(values, 95),
+        'peak_mb': peak / (1024 * 1024) if peak is not None else None,
+    }
+
+
+def _time_each(func, items):
+    """items 각각에 대해 func을 호출하여 걸린 시간 리스트를 반환"""
+    durations = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for item in items:
+            start = time.perf_counter()
+            func(item)
+            durations.append(time.perf_counter() - start)
+    return durations
+
+
+# --- 2. 단계별 벤치마크 ---
+def bench_parse_player_input(scale, track_memory=True):
+    text = mockserver.mock_input_text(scale)
+    lines = text.split('\n')
+    return measure(
+        'parse_player_input', scale,
+        lambda: len(statcroling.parse_player_input(text)),
+        lambda: _time_each(statcroling.parse_player_input, lines),
+        track_memory,
+    )
+
+
+def bench_format_player_data(scale, track_memory=True):
+    text = mockserver.mock_draft_text(scale)
+    lines = [line for line in text.split('\n') if not line.endswith('→')]
+    return measure(
+        'format_player_data', scale,
+        lambda: len(playertext.format_player_data(text)),
+        lambda: _time_each(playertext.format_player_data, lines),
+        track_memory,
+    )
+
+
+def bench_iter_roster_players(scale, track_memory=True):
+    text = mockserver.mock_draft_text(scale)
+    lines = [line for line in text.split('\n') if not line.endswith('→')]
+    return measure(
+        'iter_roster_players', scale,
+        lambda: sum(1 for _ in playertext.iter_roster_players(text)),
+        lambda: _time_each(lambda line: list(playertext.iter_roster_players([line])), lines),
+        track_memory,
+    )
+
+
+def bench_roster_dataframe(scale, track_memory=True):
+    text = mockserver.mock_draft_text(scale)
+    return measure(
+        'roster_dataframe', scale,
+        lambda: len(playertext.roster_dataframe(text)),
+        None,
+        track_memory,
+    )
+
+
+def _mock_records(scale):
+    records = {}
+    for player in mockserver.mock_players(scale):
+        record_html = mockserver.render_record_section(player['person_no'], player['position'], 2020, 2025)
+        records[statcroling.player_key(player)] = statcroling.make_player_record(player, record_html)
+    return records
+
+
+def bench_save_to_excel(scale, track_memory=True):
+    records = _mock_records(scale)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, 'bench.xlsx')
+        return measure(
+            'save_to_excel', scale,
+            lambda: statcroling.save_to_excel(records, filename) or len(records),
+            None,
+            track_memory,
+        )
+
+
+def bench_export_long(scale, track_memory=True):
+    """롱 포맷 시트 하나로 스트리밍 저장 (constant_memory)"""
+    from kbhughscrap import recordexport
+    records = _mock_records(scale)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, 'bench_long.xlsx')
+        return measure(
+            'export:long', scale,
+            lambda: recordexport.export_records(records.values(), filename, 'long'),
+            None,
+            track_memory,
+        )
+
+
+def bench_fetch(mode, scale, base_url, num_workers=None, track_memory=True):
+    """모의 서버를 상대로 수집 방식(mode) 하나를 측정. 브라우저를 띄울 수 없으면 None"""
+    players = mockserver.mock_players(scale)
+    if mode == 'http':
+        from kbhughscrap import recordfetch
+        fetch_func = recordfetch.fetch_player_stats
+    else:
+        if mode != 'selenium-index':
+            for player in players:
+                del player['club_idx'], player['person_no']
+        if mode == 'parallel':
+            fetch_func = partial(statcroling.scrape_player_stats_parallel, num_workers=num_workers)
+        else:
+            fetch_func = partial(statcroling.scrape_player_stats, headless=True)
+
+    def run():
+        succeeded = []
+        fetch_func(players, base_url, on_result=lambda player, html: succeeded.append(html != statcroling.NO_DATA_HTML))
+        return sum(succeeded)
+
+    reset_traces()
+    result = measure(f"fetch:{mode}", scale, run, None, track_memory)
+    step = latency_report().get(statcroling.PLAYER_STEP)
+    if step is None:
+        # 브라우저 시작 실패 등으로 선수 단위 기록이 하나도 없음
+        return None
+    result['p50'], result['p95'] = step['p50'], step['p95']
+    return result
+
+
+# --- 3. 실행 및 출력 ---
+def run_benchmarks(scales=DEFAULT_SCALES, modes=('http',), delay=0.0, num_workers=None, track_memory=True):
+    """모든 단계와 수집 방식을 규모별로 측정하여 결과 리스트를 반환"""
+    results = []
+    server, base_url = mockserver.start_mock_server(num_players=max(scales), delay=delay)
+    try:
+        for scale in scales:
+            results.append(bench_parse_player_input(scale, track_memory))
+            results.append(bench_format_player_data(scale, track_memory))
+            results.append(bench_iter_roster_players(scale, track_memory))
+            results.append(bench_roster_dataframe(scale, track_memory))
+            results.append(bench_save_to_excel(scale, track_memory))
+            results.append(bench_export_long(scale, track_memory))
+            for mode in modes:
+                result = bench_fetch(mode, scale, base_url, num_workers, track_memory)
+                if result is None:
+                    print(f"'{mode}' 방식은 브라우저를 시작할 수 없어 건너뜁니다.")
+                    continue
+                results.append(result)
+    finally:
+        server.shutdown()
+    return results
+
+
+def print_results(results):
+    """측정 결과를 표 형태로 출력"""
+    def fmt(value, spec):
+        return format(value, spec) if value is not None else '-'
+
+    print(f"{'대상':<24}{'선수 수':>8}{'성공':>8}{'소요(s)':>10}{'선수/분':>12}{'p50(ms)':>10}{'p95(ms)':>10}{'최대 메모리(MB)':>16}")
+    for r in results:
+        p50 = r['p50'] * 1000 if r['p50'] is not None else None
+        p95 = r['p95'] * 1000 if r['p95'] is not None else None
+        print(
+            f"{r['target']:<24}{r['scale']:>8}{r['succeeded']:>8}{r['seconds']:>10.3f}"
+            f"{fmt(r['players_per_minute'], ',.0f'):>12}{fmt(p50, '.2f'):>10}{fmt(p95, '.2f'):>10}"
+            f"{fmt(r['peak_mb'], '.1f'):>16}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="모의 기록 사이트를 상대로 한 스크래퍼 성능 측정")
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES), help="측정할 선수 수")
+    parser.add_argument('--modes', nargs='+', default=['http'], choices=sorted(FETCH_MODES), help="측정할 수집 방식")
+    parser.add_argument('--delay', type=float, default=0.0, help="모의 서버 요청당 지연 시간(초)")
+    parser.add_argument('--workers', type=int, default=None, help="parallel 방식의 브라우저 세션 수")
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 메모리 측정 끄기 (처리량만 측정)")
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일 경로 (회귀 비교용)")
+    args = parser.parse_args()
+
+    bench_results = run_benchmarks(args.scales, args.modes, args.delay, args.workers, not args.no_memory)
+    print_results(bench_results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(bench_results, f, ensure_ascii=False, indent=1)
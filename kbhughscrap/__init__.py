@@ -0,0 +1,2 @@
+# 고교 야구 선수 기록 수집 도구 (명령행 진입점은 kbhughscrap.cli)
+# 하위 모듈은 필요할 때만 불러오도록 여기서는 아무것도 불러오지 않습니다 (selenium/pandas 시작 비용).
@@ -0,0 +1,6 @@
+import sys
+
+from .cli import main
+
+# python -m kbhughscrap ... (설치된 kbhughscrap 명령과 같음)
+sys.exit(main())
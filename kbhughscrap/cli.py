@@ -0,0 +1,249 @@
+import argparse
+import json
+import os
+import sys
+
+# 명령행 진입점: kbhughscrap parse | index | scrape | export | stats
+# 하위 명령에 필요한 모듈만 그 명령 안에서 불러옵니다 (parse/export/stats는 selenium을 불러오지 않음).
+
+DEFAULT_EXCEL_PATH = "kbo_player_stats_final.xlsx"
+
+# Excel 레이아웃 (recordexport.LAYOUTS와 같음. 파서를 만들 때 xlsxwriter를 불러오지 않도록 따로 둠)
+EXCEL_LAYOUTS = ('long', 'sheets', 'both')
+LAYOUT_HELP = "Excel 레이아웃: long(선수/학교/포지션/시즌 시트 하나, 메모리 일정), sheets(선수별 시트), both"
+
+# 기록 캐시 기본값 (recordcache.DEFAULT_CACHE_DIR/DEFAULT_TTL/DEFAULT_MAX_BYTES와 같음)
+DEFAULT_CACHE_DIR = "kbo_record_cache"
+DEFAULT_CACHE_TTL_HOURS = '24'
+DEFAULT_CACHE_MAX_MB = 200
+
+
+def _open_existing_store(path):
+    """이미 있는 결과 저장소만 엶 (없으면 None, 빈 저장소 파일을 새로 만들지 않음)"""
+    from .recordstore import DEFAULT_STORE_PATH, open_record_store
+
+    path = path or DEFAULT_STORE_PATH
+    if not os.path.exists(path):
+        print(f"오류: 결과 저장소 '{path}'가 없습니다. 먼저 scrape를 실행하세요.", file=sys.stderr)
+        return None
+    return open_record_store(path)
+
+
+def _workers(value):
+    """--workers 값: 'auto'면 None (CPU 코어 수), 아니면 0 이상의 정수"""
+    if value == 'auto':
+        return None
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수 또는 'auto'여야 합니다: {value}")
+    if workers < 0:
+        raise argparse.ArgumentTypeError(f"0 이상이어야 합니다: {value}")
+    return workers
+
+
+def _cache_ttl(value):
+    """--cache-ttl 값(시간): 'never'면 None (만료 없음), 아니면 초 단위 정수"""
+    if value == 'never':
+        return None
+    try:
+        hours = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"시간(숫자) 또는 'never'여야 합니다: {value}")
+    if hours < 0:
+        raise argparse.ArgumentTypeError(f"0 이상이어야 합니다: {value}")
+    return int(hours * 60 * 60)
+
+
+# --- 1. 하위 명령 ---
+def cmd_parse(args):
+    """명단을 파싱하여 선수 정보를 출력 (TSV 또는 JSON lines)"""
+    from .playertext import iter_roster_file
+
+    out = sys.stdout
+    for player in iter_roster_file(args.roster):
+        if args.format == 'jsonl':
+            out.write(json.dumps(player, ensure_ascii=False) + "\n")
+        else:
+            out.write(f"{player['name']}\t{player['school']}\t{player['position']}\t"
+                      f"{player['raw_position']}\t{player['round']}\t{'-'.join(player['schools'])}\n")
+    return 0
+
+
+def cmd_index(args):
+    """학교/선수 드롭다운을 크롤링하여 ID 인덱스를 만들거나 갱신 (scrape --http에 필요)"""
+    from .playerindex import DEFAULT_INDEX_PATH, build_player_index
+    from .playertext import load_roster
+    from .statcroling import DEFAULT_BASE_URL
+    from .tracing import configure_tracing
+
+    schools = list(args.school or [])
+    if args.roster:
+        schools += [player['school'] for player in load_roster(args.roster)]
+    configure_tracing(args.log_level)
+    index = build_player_index(
+        args.url or DEFAULT_BASE_URL, list(dict.fromkeys(schools)) or None,
+        path=args.index or DEFAULT_INDEX_PATH, refresh=args.refresh, headless=not args.show_browser,
+    )
+    players = sum(len(names) for names in index['players'].values())
+    print(f"인덱스: 학교 {len(index['schools'])}개, 선수 {players}명")
+    return 0 if index['schools'] else 1
+
+
+def cmd_scrape(args):
+    """명단의 선수 기록을 수집하여 결과 저장소에 쌓고 Excel로 내보냄"""
+    from .playertext import load_roster
+    from .statcroling import DEFAULT_BASE_URL, run_pipeline
+    from .tracing import close_tracing, configure_tracing
+
+    players = load_roster(args.roster)
+    fetch_func = None
+    if args.http:
+        from .recordfetch import fetch_player_stats
+        fetch_func = fetch_player_stats
+
+    configure_tracing(args.log_level, args.trace)
+    try:
+        failed = run_pipeline(
+            players, args.url or DEFAULT_BASE_URL,
+            num_workers=args.workers, cache_only=args.cache_only, resume=args.resume,
+            headless=not args.show_browser, fetch_func=fetch_func,
+            store_path=args.store, excel_path=None if args.no_excel else args.output,
+            incremental=args.incremental, excel_layout=args.layout,
+            cache_dir=args.cache_dir, cache_ttl=args.cache_ttl, cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+            index_path=args.index,
+        )
+    finally:
+        close_tracing()
+    return 1 if failed else 0
+
+
+def cmd_export(args):
+    """결과 저장소의 기록을 Excel로 내보냄 (브라우저 없이, 선수 한 명씩 스트리밍)"""
+    from .playertext import load_roster
+    from .recordexport import export_store
+
+    players = load_roster(args.roster) if args.roster else None
+    conn = _open_existing_store(args.store)
+    if conn is None:
+        return 1
+    try:
+        written = export_store(conn, args.output, players, args.layout)
+    finally:
+        conn.close()
+    if not written:
+        print("저장소에 내보낼 기록이 없습니다.", file=sys.stderr)
+        return 1
+    print(f"{written}명의 기록을 '{args.output}' 파일에 저장했습니다.")
+    return 0
+
+
+def _print_leaders(conn, stat, top):
+    """통산 기록 기준 포지션별 상위 선수 출력"""
+    from .recordanalytics import career_totals, load_stats_frame, rank_players
+
+    totals = career_totals(load_stats_frame(conn))
+    if stat not in totals.columns:
+        print(f"오류: '{stat}' 기록이 없습니다. 사용 가능: {', '.join(map(str, totals.columns[3:]))}", file=sys.stderr)
+        return 1
+    leaders = rank_players(totals, stat, top=top)
+    for position, group in leaders.groupby('position', observed=True):
+        print(f"{position} {stat} 상위 {top}위:")
+        for rank, name, school, value in zip(group['rank'], group['name'], group['school'], group[stat]):
+            print(f"  {rank:>3}. {name} ({school}) {value:.3f}" if isinstance(value, float) else
+                  f"  {rank:>3}. {name} ({school}) {value}")
+    return 0
+
+
+def cmd_stats(args):
+    """결과 저장소 요약 (선수 수, 포지션/학교별 인원, 시즌 범위) 또는 기록별 순위"""
+    from .recordstore import store_summary
+
+    conn = _open_existing_store(args.store)
+    if conn is None:
+        return 1
+    try:
+        if args.leaders:
+            return _print_leaders(conn, args.leaders, args.top)
+        summary = store_summary(conn)
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=1))
+        return 0
+    print(f"선수 {summary['players']}명, 기록 행 {summary['rows']}개, 시즌 {summary['first_season']}~{summary['last_season']}")
+    for position, count in summary['by_position'].items():
+        print(f"  {position}: {count}명")
+    print("학교별 인원 (상위):")
+    for school, count in summary['top_schools']:
+        print(f"  {school}: {count}명")
+    return 0
+
+
+# --- 2. 인자 파서 ---
+def build_parser():
+    parser = argparse.ArgumentParser(prog='kbhughscrap', description="고교 야구 선수 기록 수집 도구")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    parse_cmd = subparsers.add_parser('parse', help="명단 텍스트를 선수 정보로 변환")
+    parse_cmd.add_argument('roster', help="명단 파일 경로 ('-'이면 표준 입력)")
+    parse_cmd.add_argument('--format', choices=('tsv', 'jsonl'), default='tsv', help="출력 형식")
+    parse_cmd.set_defaults(func=cmd_parse)
+
+    index_cmd = subparsers.add_parser('index', help="학교/선수 ID 인덱스 만들기 (드롭다운 크롤링)")
+    index_cmd.add_argument('--roster', help="이 명단에 나오는 학교만 크롤링 (기본값: 전체 학교)")
+    index_cmd.add_argument('--school', action='append', help="크롤링할 학교 (여러 번 지정 가능)")
+    index_cmd.add_argument('--refresh', action='store_true', help="이미 인덱스에 있는 학교도 다시 크롤링")
+    index_cmd.add_argument('--index', help="인덱스 파일 경로 (기본값: kbo_player_index.json)")
+    index_cmd.add_argument('--url', help="기록 페이지 URL (기본값: KBO 고교 기록실)")
+    index_cmd.add_argument('--show-browser', action='store_true', help="headless가 아닌 창 모드로 실행")
+    index_cmd.add_argument('--log-level', default='INFO', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'), help="로그 수준")
+    index_cmd.set_defaults(func=cmd_index)
+
+    scrape_cmd = subparsers.add_parser('scrape', help="선수 기록 수집 후 저장소/Excel 저장")
+    scrape_cmd.add_argument('roster', help="명단 파일 경로 ('-'이면 표준 입력)")
+    scrape_cmd.add_argument('--url', help="기록 페이지 URL (기본값: KBO 고교 기록실)")
+    scrape_cmd.add_argument('--workers', type=_workers, default=0,
+                            help="병렬 브라우저 세션 수 (0이면 순차 처리, 'auto'면 CPU 코어 수)")
+    scrape_cmd.add_argument('--http', action='store_true', help="브라우저 없이 HTTP로 수집 (인덱스에 있는 선수만)")
+    scrape_cmd.add_argument('--index', help="학교/선수 ID 인덱스 파일 경로 (기본값: kbo_player_index.json, index 명령과 같은 값)")
+    scrape_cmd.add_argument('--cache-only', action='store_true', help="캐시된 기록만 사용")
+    scrape_cmd.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="기록 HTML 캐시 디렉터리 (기본값: kbo_record_cache)")
+    scrape_cmd.add_argument('--cache-ttl', type=_cache_ttl, default=DEFAULT_CACHE_TTL_HOURS, metavar='HOURS',
+                            help="캐시 유효 기간(시간, 기본값: 24). 'never'면 만료 없음 (은퇴 선수 등 기록이 바뀌지 않을 때)")
+    scrape_cmd.add_argument('--cache-max-mb', type=int, default=DEFAULT_CACHE_MAX_MB, help="캐시 최대 크기(MB, 기본값: 200)")
+    scrape_cmd.add_argument('--resume', action='store_true', help="이전 실행에서 완료된 선수는 건너뜀")
+    scrape_cmd.add_argument('--incremental', action='store_true', help="저장소에 있는 선수는 마감되지 않은 새 시즌만 받아 합침")
+    scrape_cmd.add_argument('--show-browser', action='store_true', help="headless가 아닌 창 모드로 실행")
+    scrape_cmd.add_argument('--store', help="결과 저장소(SQLite) 경로 (기본값: kbo_player_stats.sqlite)")
+    scrape_cmd.add_argument('-o', '--output', default=DEFAULT_EXCEL_PATH, help="Excel 파일 경로")
+    scrape_cmd.add_argument('--no-excel', action='store_true', help="Excel 파일을 만들지 않음")
+    scrape_cmd.add_argument('--layout', choices=EXCEL_LAYOUTS, default='sheets', help=LAYOUT_HELP)
+    scrape_cmd.add_argument('--log-level', default='INFO', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'), help="로그 수준")
+    scrape_cmd.add_argument('--trace', help="단계별 소요 시간을 기록할 JSON-lines 파일 경로")
+    scrape_cmd.set_defaults(func=cmd_scrape)
+
+    export_cmd = subparsers.add_parser('export', help="저장소의 기록을 Excel로 내보내기")
+    export_cmd.add_argument('--store', help="결과 저장소(SQLite) 경로 (기본값: kbo_player_stats.sqlite)")
+    export_cmd.add_argument('--roster', help="이 명단의 선수만 입력 순서대로 내보냄")
+    export_cmd.add_argument('-o', '--output', default=DEFAULT_EXCEL_PATH, help="Excel 파일 경로")
+    export_cmd.add_argument('--layout', choices=EXCEL_LAYOUTS, default='sheets', help=LAYOUT_HELP)
+    export_cmd.set_defaults(func=cmd_export)
+
+    stats_cmd = subparsers.add_parser('stats', help="저장소 요약 통계")
+    stats_cmd.add_argument('--store', help="결과 저장소(SQLite) 경로 (기본값: kbo_player_stats.sqlite)")
+    stats_cmd.add_argument('--json', action='store_true', help="JSON으로 출력")
+    stats_cmd.add_argument('--leaders', metavar='STAT', help="통산 기록 기준 포지션별 순위 (예: ERA, OPS, 홈런)")
+    stats_cmd.add_argument('--top', type=int, default=10, help="--leaders로 출력할 순위 수")
+    stats_cmd.set_defaults(func=cmd_stats)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# 브라우저 안에서 한 번의 스크립트 실행으로 DOM을 읽고 조작하는 함수 모음.
+# find_elements 후 요소마다 .text를 읽으면 요소 수만큼 WebDriver 왕복이 생기고
+# 그 사이에 StaleElementReferenceException이 날 수 있어, 목록 전체를 한 번에 가져옵니다.
+
+# 열려 있는('abs_select on') 드롭다운의 옵션 <li>
+ACTIVE_OPTIONS_XPATH = "//div[contains(@class, 'abs_select') and contains(@class, 'on')]//ul/li"
+
+# XPath로 찾은 노드 목록을 배열로 만드는 공통 스크립트 조각
+_SNAPSHOT_JS = """
+function snapshot(xpath) {
+    var result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+    return nodes;
+}
+function textOf(node) { return (node.innerText || node.textContent || '').trim(); }
+"""
+
+# 옵션 <li>의 [전체 텍스트, 값(data-value 등)] 목록
+READ_OPTIONS_SCRIPT = _SNAPSHOT_JS + """
+return snapshot(arguments[0]).map(function (li) {
+    var a = li.querySelector('a') || li;
+    var value = li.getAttribute('data-value') || li.getAttribute('value')
+        || a.getAttribute('data-value') || a.getAttribute('data-idx') || '';
+    return [textOf(li), value];
+});
+"""
+
+# index번째 옵션이 expected 텍스트면 클릭, 목록이 바뀌었으면 텍스트로 다시 찾아 클릭
+CLICK_OPTION_SCRIPT = _SNAPSHOT_JS + """
+var items = snapshot(arguments[0]);
+var target = items[arguments[1]];
+if (!target || textOf(target) !== arguments[2]) {
+    target = null;
+    for (var i = 0; i < items.length; i++) {
+        if (textOf(items[i]) === arguments[2]) { target = items[i]; break; }
+    }
+}
+if (!target) { return false; }
+target.scrollIntoView({block: 'nearest'});
+target.click();
+return true;
+"""
+
+# XPath 첫 노드의 outerHTML (없으면 null)
+READ_OUTER_HTML_SCRIPT = _SNAPSHOT_JS + """
+var nodes = snapshot(arguments[0]);
+return nodes.length ? nodes[0].outerHTML : null;
+"""
+
+
+def core_text(full_text):
+    """옵션 텍스트의 핵심 부분 (괄호 앞 부분)"""
+    return full_text.split('(')[0].strip()
+
+
+def read_options(driver, options_xpath=ACTIVE_OPTIONS_XPATH):
+    """옵션 <li> 전체를 [(전체 텍스트, 값), ...]으로 한 번에 읽음"""
+    return [(text, value) for text, value in driver.execute_script(READ_OPTIONS_SCRIPT, options_xpath) or []]
+
+
+def build_option_map(options, placeholder=None):
+    """
+    {핵심 텍스트: 옵션 위치} 맵을 만듭니다. 빈 텍스트와 기본 옵션("학교명", "선수명" 등)은 제외하고,
+    같은 핵심 텍스트가 여러 개면 처음 것을 사용합니다.
+    """
+    option_map = {}
+    for index, (full_text, _) in enumerate(options):
+        core = core_text(full_text)
+        if core and core != placeholder:
+            option_map.setdefault(core, index)
+    return option_map
+
+
+def click_option(driver, options_xpath, index, expected_text):
+    """index번째 옵션을 스크롤 후 클릭 (스크립트 한 번). 대상이 없으면 False"""
+    return bool(driver.execute_script(CLICK_OPTION_SCRIPT, options_xpath, index, expected_text))
+
+
+def read_outer_html(driver, xpath):
+    """XPath 첫 요소의 outerHTML (없으면 None). wait_for 조건으로도 사용 가능"""
+    return driver.execute_script(READ_OUTER_HTML_SCRIPT, xpath)
+
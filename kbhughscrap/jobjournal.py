@@ -0,0 +1,148 @@
+import time
+
+from .recordparse import NO_DATA_HTML
+from .tracing import logger
+
+# 작업 상태
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    name        TEXT NOT NULL,
+    school      TEXT NOT NULL,
+    position    TEXT NOT NULL,
+    state       TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    reason      TEXT,
+    updated_at  REAL NOT NULL,
+    PRIMARY KEY (name, school, position)
+);
+"""
+
+
+# --- 1. 작업 기록 ---
+def init_job_journal(conn):
+    """SQLite 연결(보통 recordstore 저장소)에 jobs 테이블을 준비"""
+    conn.executescript(SCHEMA)
+
+
+def _player_id(player):
+    return (player['name'], player['school'], player['position'])
+
+
+def register_jobs(conn, player_list, resume=False):
+    """
+    선수 리스트를 작업으로 등록합니다.
+    resume=False면 모두 pending으로 초기화하고, True면 기존 상태를 유지하며 새 선수만 추가합니다.
+    """
+    conflict = "IGNORE" if resume else "REPLACE"
+    now = time.time()
+    with conn:
+        conn.executemany(
+            f"INSERT OR {conflict} INTO jobs (name, school, position, state, attempts, updated_at)"
+            " VALUES (?, ?, ?, ?, 0, ?)",
+            [_player_id(player) + (PENDING, now) for player in player_list],
+        )
+
+
+def mark_job(conn, player, state, reason=None):
+    """작업 상태를 기록 (실패 시 시도 횟수 증가)"""
+    with conn:
+        conn.execute(
+            "UPDATE jobs SET state = ?, reason = ?, updated_at = ?,"
+            " attempts = attempts + (CASE WHEN ? = ? THEN 1 ELSE 0 END)"
+            " WHERE name = ? AND school = ? AND position = ?",
+            (state, reason, time.time(), state, FAILED) + _player_id(player),
+        )
+
+
+def job_states(conn, player_list):
+    """{(이름, 학교, 포지션): (상태, 시도 횟수, 사유)}"""
+    states = {}
+    for player in player_list:
+        row = conn.execute(
+            "SELECT state, attempts, reason FROM jobs WHERE name = ? AND school = ? AND position = ?",
+            _player_id(player),
+        ).fetchone()
+        if row is not None:
+            states[_player_id(player)] = row
+    return states
+
+
+def unfinished_players(conn, player_list):
+    """아직 done이 아닌 선수만 입력 순서대로 반환"""
+    states = job_states(conn, player_list)
+    return [player for player in player_list if states.get(_player_id(player), (PENDING,))[0] != DONE]
+
+
+# --- 2. 재시도 실행 ---
+def run_jobs(conn, player_list, base_url, fetch_func, on_result=None, max_attempts=3, backoff=5.0, resume=False):
+    """
+    작업 기록을 남기며 선수 기록을 수집합니다.
+
+    성공한 선수는 done, 실패한 선수는 failed(사유 포함)로 기록하고, 실패한 선수만 모아
+    backoff * 2^n 초 뒤 새 세션(fetch_func 재호출)으로 다시 시도합니다.
+    mark_permanent_failure로 표시된 실패(캐시 전용 모드의 캐시 누락 등)는 재시도하지 않습니다.
+    resume=True면 이전 실행에서 done이 된 선수는 건너뜁니다.
+
+    Args:
+        conn: init_job_journal을 거친 SQLite 연결.
+        player_list (list): parse_player_input 결과.
+        base_url (str): 기록 페이지 URL.
+        fetch_func (callable): (player_list, base_url, on_result=...) 형태의 수집 함수.
+        on_result (callable): 성공한 선수에 대해서만 호출되는 콜백 (player, html).
+        max_attempts (int): 선수별 최대 시도 횟수.
+        backoff (float): 재시도 대기 기본 시간(초).
+        resume (bool): 이전 작업 상태를 이어서 처리할지 여부.
+
+    Returns:
+        list: 최종적으로 실패한 선수 리스트.
+    """
+    register_jobs(conn, player_list, resume)
+    pending = unfinished_players(conn, player_list)
+    if resume:
+        logger.info(f"이어서 처리: 전체 {len(player_list)}명 중 남은 선수 {len(pending)}명")
+
+    given_up = []  # 재시도해도 소용없는 실패 (mark_permanent_failure)
+    for attempt in range(max_attempts):
+        if not pending:
+            break
+        if attempt > 0:
+            delay = backoff * (2 ** (attempt - 1))
+            logger.info(f"\n실패한 {len(pending)}명 재시도 ({attempt + 1}/{max_attempts}), {delay:.0f}초 대기...")
+            time.sleep(delay)
+
+        failed = []
+        reported = set()
+
+        def record_result(player, record_html):
+            reported.add(_player_id(player))
+            retryable = player.pop('retry', True)
+            if record_html and record_html != NO_DATA_HTML:
+                # 결과를 먼저 저장한 뒤 done으로 표시 (중간에 죽어도 done인데 데이터가 없는 경우가 없도록)
+                if on_result is not None:
+                    on_result(player, record_html)
+                mark_job(conn, player, DONE)
+            else:
+                mark_job(conn, player, FAILED, player.get('error', "기록 추출 실패"))
+                (failed if retryable else given_up).append(player)
+
+        fetch_func(pending, base_url, on_result=record_result)
+        for player in pending:
+            if _player_id(player) not in reported:
+                mark_job(conn, player, FAILED, "수집되지 않음 (브라우저 시작 실패 등)")
+                failed.append(player)
+        pending = failed
+
+    # 최종 실패는 재시도 소진과 재시도 제외를 합쳐 입력 순서대로
+    failed_ids = {_player_id(player) for player in pending + given_up}
+    pending = [player for player in player_list if _player_id(player) in failed_ids]
+    if pending:
+        states = job_states(conn, pending)
+        logger.warning(f"\n최종 실패 {len(pending)}명:")
+        for player in pending:
+            _, attempts, reason = states[_player_id(player)]
+            logger.warning(f"  {player['name']} ({player['school']}, {player['position']}): {reason} (시도 {attempts}회)")
+    return pending
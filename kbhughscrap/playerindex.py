@@ -0,0 +1,203 @@
+import json
+import os
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from .domquery import core_text
+from .tracing import logger
+from .statcroling import (
+    create_driver,
+    options_li_xpath,
+    player_dropdown_trigger_xpath,
+    read_form_value,
+    school_dropdown_trigger_xpath,
+    select_dropdown_option,
+)
+from .waitengine import options_populated, wait_for
+
+# 인덱스 파일 기본 경로
+DEFAULT_INDEX_PATH = "kbo_player_index.json"
+
+
+# --- 1. 인덱스 파일 읽기/쓰기 ---
+def load_player_index(path=DEFAULT_INDEX_PATH):
+    """
+    로컬 인덱스 파일을 읽어옵니다. 파일이 없으면 빈 인덱스를 반환합니다.
+
+    인덱스 형태:
+        {'schools': {학교명: club_idx},
+         'players': {학교명: {선수명: person_no}},
+         'refreshed': {학교명: 마지막 크롤링 시각(epoch)}}
+    """
+    index = {'schools': {}, 'players': {}, 'refreshed': {}}
+    if os.path.exists(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                index.update(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"경고: 인덱스 파일('{path}')을 읽을 수 없어 새로 만듭니다: {e}")
+    return index
+
+
+def save_player_index(index, path=DEFAULT_INDEX_PATH):
+    """인덱스를 파일에 저장 (임시 파일에 쓴 뒤 교체하여 중간에 깨지지 않도록 함)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+# --- 2. 조회 및 갱신 ---
+def lookup_player_ids(index, name, school):
+    """(이름, 학교)에 해당하는 (club_idx, person_no) 반환. 없으면 (None, None)"""
+    club_idx = index['schools'].get(school)
+    person_no = index['players'].get(school, {}).get(name)
+    if club_idx and person_no:
+        return club_idx, person_no
+    return None, None
+
+
+def remember_player_ids(index, name, school, club_idx, person_no):
+    """(이름, 학교) → ID 매핑을 인덱스에 추가"""
+    index['schools'][school] = club_idx
+    index['players'].setdefault(school, {})[name] = person_no
+
+
+def forget_player_ids(index, name, school):
+    """(이름, 학교)의 person_no를 인덱스에서 지움 (학교의 club_idx는 다른 선수가 쓰므로 남김)"""
+    index['players'].get(school, {}).pop(name, None)
+
+
+def attach_player_ids(player_list, index):
+    """
+    선수 리스트에 인덱스의 club_idx/person_no를 채워 넣습니다.
+    채워진 선수는 scrape_record_html에서 드롭다운 없이 기록 URL로 바로 이동합니다.
+    인덱스 적중 수를 반환합니다.
+    """
+    hits = 0
+    for player in player_list:
+        club_idx, person_no = lookup_player_ids(index, player['name'], player['school'])
+        if club_idx:
+            player['club_idx'] = club_idx
+            player['person_no'] = person_no
+            hits += 1
+    logger.info(f"인덱스 적중: {hits}/{len(player_list)}명")
+    return hits
+
+
+def update_index_from_players(index, player_list):
+    """
+    스크래핑 중 드롭다운 선택으로 알아낸 ID를 인덱스에 반영. 바뀐 항목 수를 반환
+    직접 URL에서 기록을 찾지 못한 선수(player['stale_ids'])는 인덱스에서 지우고,
+    드롭다운으로 다른 ID를 알아낸 경우에만 새 ID를 다시 넣습니다.
+    """
+    changed = 0
+    for player in player_list:
+        stale_ids = player.pop('stale_ids', None)
+        ids = (player.get('club_idx'), player.get('person_no'))
+        if stale_ids is not None and ids in (stale_ids, (None, None)):
+            if lookup_player_ids(index, player['name'], player['school']) != (None, None):
+                forget_player_ids(index, player['name'], player['school'])
+                changed += 1
+            continue
+        if not all(ids):
+            continue
+        if lookup_player_ids(index, player['name'], player['school']) != ids:
+            remember_player_ids(index, player['name'], player['school'], *ids)
+            changed += 1
+    return changed
+
+
+# --- 3. 드롭다운 크롤링으로 인덱스 구축 ---
+def _open_dropdown_and_read(driver, wait, trigger_xpath, placeholder):
+    """드롭다운을 열고 [(핵심 텍스트, 값)] 리스트를 반환한 뒤 다시 닫습니다."""
+    trigger = wait_for(driver, EC.element_to_be_clickable((By.XPATH, trigger_xpath)), "인덱스 드롭다운")
+    driver.execute_script("arguments[0].click();", trigger)
+    # 로딩 대기 조건이 옵션 텍스트와 값을 한 번에 읽어 반환함
+    options = [
+        (core_text(text), value)
+        for text, value in wait_for(driver, options_populated(placeholder), "인덱스 옵션 로딩")
+    ]
+    driver.execute_script("arguments[0].click();", trigger)
+    return options
+
+
+def _crawl_school(driver, wait, base_url, school):
+    """한 학교의 club_idx와 소속 선수별 person_no를 수집. 실패 시 (None, {})"""
+    driver.get(base_url)
+    wait_for(driver, EC.presence_of_element_located((By.XPATH, school_dropdown_trigger_xpath)), "페이지 로드 대기")
+    if not select_dropdown_option(driver, wait, school_dropdown_trigger_xpath, school, options_li_xpath, "학교"):
+        return None, {}
+    club_idx = read_form_value(driver, 'club_idx')
+
+    players = {}
+    missing = []
+    for name, value in _open_dropdown_and_read(driver, wait, player_dropdown_trigger_xpath, "선수명"):
+        if not name or name == "선수명":
+            continue
+        if value:
+            players[name] = value
+        else:
+            missing.append(name)
+
+    # <li>에 값이 없는 경우에는 직접 선택해서 폼에 채워진 person_no를 읽음
+    for name in missing:
+        if select_dropdown_option(driver, wait, player_dropdown_trigger_xpath, name, options_li_xpath, "선수"):
+            person_no = read_form_value(driver, 'person_no')
+            if person_no:
+                players[name] = person_no
+
+    return club_idx, players
+
+
+def build_player_index(base_url, schools=None, path=DEFAULT_INDEX_PATH, refresh=False, headless=True):
+    """
+    학교/선수 드롭다운을 크롤링하여 인덱스를 구축하고 파일에 저장합니다.
+
+    Args:
+        base_url (str): 기록 페이지 URL.
+        schools (list): 크롤링할 학교명 리스트 (기본값: 학교 드롭다운의 전체 학교).
+        path (str): 인덱스 파일 경로.
+        refresh (bool): True면 이미 인덱스에 있는 학교도 다시 크롤링 (False면 새 학교만 추가).
+        headless (bool): headless 모드 사용 여부.
+    """
+    index = load_player_index(path)
+    driver, wait = create_driver(headless)
+    if driver is None:
+        return index
+
+    try:
+        if schools is None:
+            driver.get(base_url)
+            wait_for(driver, EC.presence_of_element_located((By.XPATH, school_dropdown_trigger_xpath)), "페이지 로드 대기")
+            schools = [
+                name for name, _ in _open_dropdown_and_read(driver, wait, school_dropdown_trigger_xpath, "학교명")
+                if name and name != "학교명"
+            ]
+            logger.info(f"학교 드롭다운에서 {len(schools)}개 학교 발견.")
+
+        for school in schools:
+            if not refresh and school in index['refreshed']:
+                continue
+            logger.info(f"\n--- '{school}' 인덱스 크롤링 ---")
+            try:
+                club_idx, players = _crawl_school(driver, wait, base_url, school)
+            except Exception as e:
+                logger.warning(f"'{school}' 크롤링 중 오류 발생: {e}")
+                continue
+            if not club_idx:
+                logger.warning(f"'{school}'의 club_idx를 읽지 못했습니다.")
+                continue
+
+            index['schools'][school] = club_idx
+            index['players'].setdefault(school, {}).update(players)
+            index['refreshed'][school] = time.time()
+            logger.info(f"  club_idx={club_idx}, 선수 {len(players)}명 저장.")
+            # 학교 단위로 저장하여 중간에 중단되어도 진행분이 남도록 함
+            save_player_index(index, path)
+    finally:
+        driver.quit()
+
+    return index
@@ -0,0 +1,246 @@
+import re
+import sys
+
+# 라운드 구분자 (예: '2 →')
+ROUND_PATTERN = re.compile(r'^(\d+)\s*→$')
+# '이름 (괄호 안 내용)' 형식
+PLAYER_PATTERN = re.compile(r'^\s*([^\s(]+)\s*\((.+)\)\s*$')
+
+# '타자'로 일반화하는 포지션
+BATTER_POSITIONS = ('내야수', '외야수', '포수')
+
+
+def generalize_position(position):
+    """포지션을 '타자' 또는 '투수'로 일반화 (내야수/외야수/포수 → 타자)"""
+    return '타자' if position in BATTER_POSITIONS else position
+
+
+def _split_details(details):
+    """
+    괄호 안 내용을 (학교 부분, 포지션)으로 분리.
+    '학교1-학교2 포지션'과 이미 변환된 '학교, 포지션' 형식을 모두 지원. 실패 시 None.
+    """
+    if ',' in details:
+        school_part, _, position = details.partition(',')
+    else:
+        detail_parts = details.split()
+        if len(detail_parts) < 2:
+            return None
+        school_part, position = " ".join(detail_parts[:-1]), detail_parts[-1]  # 학교 부분을 다시 합침
+    school_part, position = school_part.strip(), position.strip()
+    if not school_part or not position:
+        return None
+    return school_part, position
+
+
+def _iter_lines(source):
+    """문자열(여러 줄), 파일 객체, 줄 단위 이터러블을 모두 줄 단위로 읽음"""
+    if isinstance(source, str):
+        return iter(source.splitlines())
+    return iter(source)
+
+
+def iter_roster_players(source, skipped=None):
+    """
+    드래프트 텍스트를 한 번에 읽어 선수 정보 dict를 하나씩 돌려줍니다.
+    결과는 그대로 scrape_player_stats 등에 넘길 수 있습니다.
+
+    Args:
+        source: 여러 줄 문자열, 파일 객체 또는 줄 단위 이터러블 (크기 제한 없음).
+                각 줄은 '이름 (학교1-학교2... 포지션)', '이름 (학교, 포지션)',
+                '이름 학교 포지션' 형식이거나 라운드 구분자('숫자 →')입니다.
+        skipped (list): 주어지면 형식이 맞지 않는 줄을 (줄, 사유)로 추가합니다.
+
+    Yields:
+        dict: {'name', 'school'(최종 출신 학교), 'position'('타자'/'투수'),
+               'raw_position', 'schools'(출신 학교 이력), 'round'}
+    """
+    round_no = 1
+    for line in _iter_lines(source):
+        line = line.strip()
+
+        # 빈 줄은 건너뛰고, 라운드 구분자(예: '2 →')는 라운드 번호만 갱신합니다.
+        if not line:
+            continue
+        round_match = ROUND_PATTERN.match(line)
+        if round_match:
+            round_no = int(round_match.group(1))
+            continue
+
+        # 그룹 1: 이름 (공백 앞까지), 그룹 2: 괄호 안의 내용 (학교 및 포지션)
+        match = PLAYER_PATTERN.match(line)
+        if match:
+            name = match.group(1).strip()
+            split = _split_details(match.group(2).strip())
+            if split is None:
+                if skipped is not None:
+                    skipped.append((line, "학교/포지션 정보를 제대로 분리할 수 없습니다."))
+                continue
+            school_part, position = split
+        else:
+            # 이름, 학교, 포지션이 공백으로만 구분된 경우 시도
+            parts = line.split()
+            if len(parts) < 3:
+                if skipped is not None:
+                    skipped.append((line, "예상된 형식이 아닙니다."))
+                continue
+            name, school_part, position = parts[0], " ".join(parts[1:-1]), parts[-1]
+
+        # 최종 출신 학교 (하이픈(-)이 있으면 마지막 부분, 없으면 전체)
+        schools = [school.strip() for school in school_part.split('-')]
+        yield {
+            'name': name,
+            'school': schools[-1],
+            'position': generalize_position(position),
+            'raw_position': position,
+            'schools': schools,
+            'round': round_no,
+        }
+
+
+def iter_roster_file(path, encoding='utf-8'):
+    """
+    드래프트 텍스트 파일('-'이면 표준 입력)을 줄 단위로 스트리밍하며 선수 정보 dict를 하나씩 돌려줍니다.
+    형식이 맞지 않는 줄은 다 읽은 뒤 한 번에 표준 에러로 경고합니다.
+    """
+    skipped = []
+    roster = sys.stdin if path == '-' else open(path, encoding=encoding)
+    try:
+        yield from iter_roster_players(roster, skipped)
+    finally:
+        if roster is not sys.stdin:
+            roster.close()
+    for line, reason in skipped:
+        print(f"경고: '{line}' 라인은 {reason}", file=sys.stderr)
+
+
+def load_roster(path, encoding='utf-8'):
+    """드래프트 텍스트 파일('-'이면 표준 입력)을 읽어 선수 정보 리스트를 반환 (경고는 표준 에러로)"""
+    return list(iter_roster_file(path, encoding))
+
+
+def roster_dataframe(source):
+    """
+    대용량 파일용 pandas 경로: 줄 단위 정규식 추출을 Series 연산으로 한 번에 처리합니다.
+    iter_roster_players와 같은 컬럼(name, school, position, raw_position, schools, round)의
+    DataFrame을 반환하며, 형식이 맞지 않는 줄은 제외됩니다.
+    """
+    import pandas as pd
+
+    lines = pd.Series(list(_iter_lines(source)), dtype='string').str.strip()
+    lines = lines[lines.str.len() > 0]
+
+    # 라운드 번호: 구분자 줄의 숫자를 아래 줄로 전파 (첫 구분자 이전은 1라운드)
+    round_marker = lines.str.extract(ROUND_PATTERN.pattern, expand=False)
+    round_no = pd.to_numeric(round_marker).ffill().fillna(1).astype(int)
+    is_player = round_marker.isna()
+    lines, round_no = lines[is_player], round_no[is_player]
+
+    # '이름 (내용)' 형식과 '이름 학교 포지션' 형식을 한 번에 분리
+    paren = lines.str.extract(PLAYER_PATTERN.pattern)
+    plain = lines.str.extract(r'^(\S+)\s+(.+)$')
+    is_paren = paren[0].notna()
+    name = paren[0].fillna(plain[0]).str.strip()
+    details = paren[1].fillna(plain[1]).str.strip()
+
+    # 괄호 안 내용: 쉼표가 있으면 '학교, 포지션', 아니면 '학교 부분 포지션' (_split_details와 같은 규칙).
+    # 괄호 없는 줄은 쉼표와 상관없이 마지막 단어가 포지션입니다.
+    use_comma = (is_paren & details.str.contains(',', regex=False)).fillna(False).astype(bool)
+    comma = details.str.extract(r'^([^,]*),(.*)$')
+    spaced = details.str.extract(r'^(.+?)\s+(\S+)$')
+    spaced_school = spaced[0].str.replace(r'\s+', ' ', regex=True)  # 학교 부분을 다시 합침
+    school_part = comma[0].where(use_comma, spaced_school).str.strip()
+    position = comma[1].where(use_comma, spaced[1]).str.strip()
+
+    frame = pd.DataFrame({
+        'name': name,
+        'school_part': school_part,
+        'raw_position': position,
+        'round': round_no,
+    }).dropna()
+    frame = frame[(frame['school_part'].str.len() > 0) & (frame['raw_position'].str.len() > 0)]
+
+    schools = frame['school_part'].str.split('-')
+    frame = frame.assign(
+        schools=schools.map(lambda parts: [part.strip() for part in parts]),
+        school=schools.str[-1].str.strip(),
+        position=frame['raw_position'].where(~frame['raw_position'].isin(BATTER_POSITIONS), '타자'),
+    )
+    return frame[['name', 'school', 'position', 'raw_position', 'schools', 'round']].reset_index(drop=True)
+
+
+def format_player_data(input_text):
+    """
+    주어진 텍스트 데이터를 파싱하여 '이름 (최종출신학교, 포지션)' 형식으로 변환합니다.
+    (스크래퍼에 넘길 때는 문자열로 변환하지 말고 iter_roster_players 결과를 바로 사용하세요.)
+
+    Args:
+        input_text (str): 여러 줄로 구성된 선수 정보 문자열.
+                          각 줄은 '이름 (학교1-학교2... 포지션)' 형식을 따르거나,
+                          라운드 구분자 ('숫자 →') 형태입니다.
+
+    Returns:
+        list: '이름 (최종출신학교, 포지션)' 형식의 문자열 리스트.
+    """
+    skipped = []
+    formatted_players = [
+        f"{player['name']} ({player['school']}, {player['raw_position']})"
+        for player in iter_roster_players(input_text, skipped)
+    ]
+    for line, reason in skipped:
+        print(f"경고: '{line}' 라인은 {reason}")
+    return formatted_players
+
+# 입력 데이터 (사용자가 제공한 스타일을 한 줄 형식으로 재구성)
+# 실제 입력 시에는 각 선수 정보가 한 줄에 있어야 합니다.
+SAMPLE_INPUT = """
+김진욱 (강릉고 투수)
+김기중 (유신고 투수)
+이재희 (대전고 투수)
+박건우 (덕수고-고려대 투수)
+권동진 (세광고-원광대 내야수)
+김주원 (유신고 내야수)
+이영빈 (세광고 내야수)
+조형우 (광주제일고 포수)
+김휘집 (신일고 내야수)
+김동주 (선린인터넷고 투수)
+2 →
+나승엽 (덕수고 내야수)
+송호정 (서울고 내야수)
+홍무원 (경기고 투수)
+장민기 (마산용마고 투수)
+한차현 (포철고-성균관대 투수)
+이용준 (서울디자인고 투수)
+김진수 (군산상고-중앙대 투수)
+고명준 (세광고 내야수)
+김준형 (성남고 투수)
+최승용 (소래고 투수)
+3 →
+김창훈 (경남고 투수)
+조은 (대전고 투수)
+오현석 (안산공고 내야수)
+이승재 (휘문고-강릉영동대 투수)
+유준규 (군산상고 내야수)
+오장한 (장안고 외야수)
+조건희 (서울고 투수)
+조병현 (세광고 투수)
+김성진 (부산정보고-계명대 투수)
+강현구 (인천고 외야수)
+4 →
+송재영 (라온고 투수)
+장규현 (인천고 포수)
+주한울 (배명고 외야수)
+권혁경 (신일고 포수)
+지명성 (신일고 투수)
+한재승 (인천고 투수)
+이믿음 (강릉고-강릉영동대 투수)
+장지훈 (김해고-동의대 투수)
+이주형 (야탑고 외야수)
+김도윤 (청주고 투수)
+"""
+
+# 함수 호출 및 결과 출력
+if __name__ == "__main__":
+    formatted_list = format_player_data(SAMPLE_INPUT)
+    for player_info in formatted_list:
+        print(player_info)
\ No newline at end of file
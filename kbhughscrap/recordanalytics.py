@@ -0,0 +1,248 @@
+import numpy as np
+import pandas as pd
+
+from .recordstore import SEASON_HEADERS
+
+# 선수 식별 컬럼
+PLAYER_COLUMNS = ['name', 'school', 'position']
+
+# 숫자로 바꾸지 않는 기록 컬럼
+TEXT_COLUMNS = {'팀명', '팀', '소속'}
+
+# '45.2' = 45⅔이닝 형식의 컬럼 (소수 첫째 자리가 아웃 카운트)
+INNINGS_COLUMNS = {'이닝'}
+
+# 사이트가 계산해서 주는 비율 기록 (합산하면 안 되며 통산에서는 다시 계산)
+RATE_COLUMNS = {'평균자책점', '승률', '타율', '출루율', '장타율', 'OPS'}
+
+# 낮을수록 좋은 기록 (순위/백분위 방향). 볼넷/삼진처럼 투수와 타자가 같은 이름을 쓰는 기록은
+# 방향이 반대이므로 포지션별로 둡니다.
+LOWER_IS_BETTER = {
+    '투수': {'평균자책점', 'ERA', 'RA9', 'WHIP', 'BB/9', '실점', '자책점', '피안타', '패', '볼넷'},
+    '타자': {'K%', '삼진'},
+}
+
+
+# --- 1. 타입이 있는 통합 프레임 ---
+def innings_to_float(values):
+    """'45.2'(45⅔) 형식의 이닝을 실제 이닝 수(45.667)로 변환 (벡터 연산)"""
+    numeric = pd.to_numeric(values, errors='coerce')
+    whole = np.floor(numeric)
+    return whole + (numeric - whole).round(1) * 10 / 3
+
+
+def typed_stats(frame):
+    """
+    문자열 기록 컬럼을 숫자 dtype으로 변환합니다.
+    정수 기록은 Int64(결측 허용), 비율/이닝은 float64, 팀명 등 숫자가 아닌 컬럼은 문자열로 남깁니다.
+    선수 식별 컬럼은 category로 바꿔 수천 명 규모에서도 메모리를 적게 씁니다.
+    """
+    frame = frame.copy()
+    for column in frame.columns:
+        if column in PLAYER_COLUMNS:
+            frame[column] = frame[column].astype('category')
+            continue
+        if column in TEXT_COLUMNS or column == 'row_no':
+            continue
+        values = frame[column]
+        if column in INNINGS_COLUMNS:
+            frame[column] = innings_to_float(values)
+            continue
+        numeric = pd.to_numeric(values, errors='coerce')
+        present = values.notna() & (values.astype('string').str.strip() != '')
+        if present.any() and numeric[present].isna().all():
+            continue  # 숫자가 아닌 컬럼
+        if column not in RATE_COLUMNS and (numeric.dropna() % 1 == 0).all():
+            numeric = numeric.astype('Int64')
+        frame[column] = numeric
+    return frame
+
+
+def records_to_frame(records):
+    """
+    기록 dict(make_player_record / iter_player_records 결과)들을 하나의 타입 있는 프레임으로 합칩니다.
+    같은 헤더 구성(투수/타자)끼리 한 번에 DataFrame으로 만든 뒤 이어 붙입니다.
+    """
+    groups = {}
+    for record in records:
+        if record['headers'] is None:
+            continue
+        identity = (record['name'], record['school'], record['position'])
+        groups.setdefault(tuple(record['headers']), []).extend(
+            identity + (row_no,) + tuple(row) for row_no, row in enumerate(record['rows'])
+        )
+    if not groups:
+        return pd.DataFrame(columns=PLAYER_COLUMNS + ['row_no', 'season'])
+
+    frames = []
+    for headers, rows in groups.items():
+        frame = pd.DataFrame(rows, columns=PLAYER_COLUMNS + ['row_no'] + list(headers))
+        season_header = next((h for h in headers if h in SEASON_HEADERS), headers[0])
+        frame.insert(4, 'season', frame[season_header])
+        frames.append(frame)
+    return typed_stats(pd.concat(frames, ignore_index=True))
+
+
+def load_stats_frame(conn, position=None):
+    """
+    결과 저장소(record_stats 롱 포맷)를 SQL 한 번으로 읽어 선수-시즌 행, 기록 컬럼의 통합 프레임으로 만듭니다.
+    투수/타자 기록은 같은 프레임에 있으며 해당하지 않는 컬럼은 결측입니다.
+
+    Args:
+        conn: open_record_store 연결.
+        position (str): '투수'/'타자' 중 하나만 읽을 때.
+    """
+    query = "SELECT name, school, position, season, row_no, stat, value FROM record_stats"
+    params = ()
+    if position is not None:
+        query += " WHERE position = ?"
+        params = (position,)
+    long = pd.read_sql_query(query, conn, params=params)
+    if long.empty:
+        return pd.DataFrame(columns=PLAYER_COLUMNS + ['row_no', 'season'])
+
+    keys = PLAYER_COLUMNS + ['row_no']
+    wide = long.set_index(keys + ['stat'])['value'].unstack('stat')
+    wide.insert(0, 'season', long.drop_duplicates(keys).set_index(keys)['season'])
+    wide = wide.reset_index()
+    wide.columns.name = None
+    return typed_stats(wide)
+
+
+# --- 2. 파생 비율 기록 ---
+def _ratio(numerator, denominator):
+    """0이나 결측으로 나누면 NaN"""
+    denominator = denominator.astype('float64')
+    return numerator.astype('float64') / denominator.where(denominator > 0)
+
+
+def add_rate_stats(frame):
+    """
+    카운팅 기록으로 비율 기록을 다시 계산해 컬럼으로 추가합니다. (있는 컬럼만 사용)
+    투수: ERA, RA9, WHIP, K/9, BB/9 / 타자: AVG, OBP, SLG, OPS, ISO, BB%, K%
+    (OBP는 사구/희생플라이 없이 (안타+볼넷)/(타수+볼넷)로 근사)
+    """
+    out = frame.copy()
+    columns = set(out.columns)
+    pitcher = out['position'] == '투수'
+    batter = ~pitcher
+
+    def col(name):
+        return out[name].astype('float64')
+
+    if '이닝' in columns:
+        innings = col('이닝')
+        if '자책점' in columns:
+            out['ERA'] = _ratio(col('자책점') * 9, innings).where(pitcher)
+        if '실점' in columns:
+            out['RA9'] = _ratio(col('실점') * 9, innings).where(pitcher)
+        if {'피안타', '볼넷'} <= columns:
+            out['WHIP'] = _ratio(col('피안타') + col('볼넷'), innings).where(pitcher)
+        if '삼진' in columns:
+            out['K/9'] = _ratio(col('삼진') * 9, innings).where(pitcher)
+        if '볼넷' in columns:
+            out['BB/9'] = _ratio(col('볼넷') * 9, innings).where(pitcher)
+
+    if {'타수', '안타'} <= columns:
+        at_bats, hits = col('타수'), col('안타')
+        out['AVG'] = _ratio(hits, at_bats).where(batter)
+        if {'2루타', '3루타', '홈런'} <= columns:
+            total_bases = hits + col('2루타') + 2 * col('3루타') + 3 * col('홈런')
+            out['SLG'] = _ratio(total_bases, at_bats).where(batter)
+            out['ISO'] = out['SLG'] - out['AVG']
+        if '볼넷' in columns:
+            plate = at_bats + col('볼넷')
+            out['OBP'] = _ratio(hits + col('볼넷'), plate).where(batter)
+            out['BB%'] = _ratio(col('볼넷'), plate).where(batter)
+            if '삼진' in columns:
+                out['K%'] = _ratio(col('삼진'), plate).where(batter)
+            if 'SLG' in out:
+                out['OPS'] = out['OBP'] + out['SLG']
+    return out
+
+
+def career_totals(frame):
+    """
+    선수별로 시즌 카운팅 기록을 합산하고 비율 기록을 다시 계산한 통산 프레임.
+    시즌 수(seasons), 첫/마지막 시즌(first_season/last_season)을 함께 붙입니다.
+    """
+    seasons = pd.to_numeric(frame['season'], errors='coerce')
+    yearly = frame[seasons.notna()].assign(season=seasons)
+    counting = [
+        column for column in yearly.select_dtypes('number').columns
+        if column not in RATE_COLUMNS and column not in SEASON_HEADERS and column not in ('row_no', 'season')
+    ]
+    grouped = yearly.groupby(PLAYER_COLUMNS, observed=True)
+    totals = grouped[counting].sum(min_count=1)
+    totals['seasons'] = grouped.size()
+    totals['first_season'] = grouped['season'].min()
+    totals['last_season'] = grouped['season'].max()
+    return add_rate_stats(totals.reset_index())
+
+
+# --- 3. 집계, 백분위, 순위 ---
+def lower_is_better(position, stat):
+    """position 선수에게 stat이 낮을수록 좋은 기록인지"""
+    return stat in LOWER_IS_BETTER.get(position, ())
+
+
+def _rank_stat(frame, stat, by, **kwargs):
+    """
+    stat의 그룹(by)별 rank. 포지션마다 방향(lower_is_better)이 다를 수 있어
+    포지션별 부호를 곱해 항상 '클수록 좋음'인 점수로 바꾼 뒤 순위를 매깁니다 (kwargs는 Series.rank 인자).
+    """
+    sign = frame['position'].map(
+        lambda position: -1.0 if lower_is_better(position, stat) else 1.0
+    ).astype('float64')
+    score = frame[stat].astype('float64') * sign
+    source = score.groupby([frame[column] for column in by], observed=True) if by else score
+    return source.rank(**kwargs)
+
+
+def group_summary(frame, by=('school', 'position'), stats=None, aggfunc='mean'):
+    """
+    학교/포지션 등 그룹별 집계. 선수 수(players)와 stats 컬럼의 aggfunc 값을 반환합니다.
+    stats를 생략하면 숫자 컬럼 전체를 집계합니다.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    if stats is None:
+        stats = [c for c in frame.select_dtypes('number').columns if c not in ('row_no', 'season')]
+    grouped = frame.groupby(by, observed=True)
+    summary = grouped[list(stats)].agg(aggfunc)
+    summary.insert(0, 'players', grouped['name'].nunique())
+    return summary
+
+
+def add_percentiles(frame, stats, by='position'):
+    """
+    stats 각각에 대해 그룹(by) 안의 백분위(0~1, 1이 가장 좋음)를 '<기록>_pct' 컬럼으로 추가합니다.
+    (포지션, 기록)이 LOWER_IS_BETTER면 낮을수록 높은 백분위가 됩니다.
+    """
+    out = frame.copy()
+    by = [by] if isinstance(by, str) else list(by or [])
+    for stat in stats:
+        out[f"{stat}_pct"] = _rank_stat(out, stat, by, pct=True)
+    return out
+
+
+def rank_players(frame, stat, by='position', top=None, min_column=None, min_value=0):
+    """
+    stat 기준 그룹(by)별 순위(동률은 같은 순위)를 매겨 정렬한 프레임을 반환합니다.
+
+    Args:
+        frame: load_stats_frame / career_totals 등의 결과.
+        stat (str): 순위 기준 컬럼 (해당 포지션에서 낮을수록 좋은 기록이면 낮은 값이 1위).
+        by (str|list): 순위를 나눌 그룹 (None이면 전체).
+        top (int): 그룹별 상위 N위까지만.
+        min_column (str): 규정 기준 컬럼 (예: '이닝', '타수').
+        min_value (float): min_column의 최소값.
+    """
+    ranked = frame[frame[stat].notna()]
+    if min_column is not None:
+        ranked = ranked[ranked[min_column].astype('float64') >= min_value]
+    by = [by] if isinstance(by, str) else list(by or [])
+    ranked = ranked.assign(rank=_rank_stat(ranked, stat, by, method='min', ascending=False).astype('int64'))
+    ranked = ranked.sort_values(by + ['rank'])
+    if top is not None:
+        ranked = ranked[ranked['rank'] <= top]
+    return ranked.reset_index(drop=True)
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlsplit, parse_qs
+
+from .recordparse import NO_DATA_HTML, content_sha256, mark_permanent_failure, player_key
+from .tracing import logger
+
+# 캐시 디렉터리 기본 경로
+DEFAULT_CACHE_DIR = "kbo_record_cache"
+
+# 기본 유효 기간 (초). None이면 만료되지 않음 (은퇴 선수 등)
+DEFAULT_TTL = 24 * 60 * 60
+
+# 캐시 디렉터리 최대 크기 (바이트). 초과 시 가장 오래 사용하지 않은 항목부터 삭제
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+# --- 1. 캐시 키 및 경로 ---
+def year_range_from_url(base_url):
+    """base_url의 begin_year/end_year 쿼리 값을 (begin_year, end_year)로 반환"""
+    query = parse_qs(urlsplit(base_url).query)
+    return query.get('begin_year', [''])[0], query.get('end_year', [''])[0]
+
+
+def player_year_range(player, begin_year, end_year):
+    """증분 갱신으로 player에 연도 범위가 지정되어 있으면 그 범위, 아니면 기본 범위"""
+    return player.get('begin_year', begin_year), player.get('end_year', end_year)
+
+
+def cache_key(player, begin_year, end_year):
+    """(선수, 학교, 포지션, 연도 범위)의 SHA-256 해시 키"""
+    identity = "\x1f".join([player['name'], player['school'], player['position'], str(begin_year), str(end_year)])
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+
+def _cache_path(cache_dir, key):
+    # 한 디렉터리에 파일이 너무 많아지지 않도록 키 앞 2글자로 나눔
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+
+# --- 2. 읽기/쓰기 ---
+def get_cached_record(player, begin_year, end_year, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL):
+    """
+    캐시된 기록 HTML을 찾습니다.
+
+    Returns:
+        tuple: (html, is_fresh). 캐시가 없거나 내용이 저장된 sha256과 다르면(깨진 항목) (None, False),
+               ttl이 지난 항목은 (html, False)로 반환되어 재검증 실패 시 대체용으로 쓸 수 있습니다.
+    """
+    path = _cache_path(cache_dir, cache_key(player, begin_year, end_year))
+    try:
+        with open(path, encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None, False
+    if content_sha256(entry['html']) != entry.get('sha256'):
+        logger.warning(f"{player['name']} 선수의 캐시 항목이 손상되어 다시 수집합니다.")
+        return None, False
+
+    # LRU 순서를 위해 사용 시각 갱신
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    is_fresh = ttl is None or time.time() - entry['fetched_at'] <= ttl
+    return entry['html'], is_fresh
+
+
+def put_cached_record(player, begin_year, end_year, record_html, cache_dir=DEFAULT_CACHE_DIR):
+    """기록 HTML을 캐시에 저장 (추출 실패 HTML은 저장하지 않음)"""
+    if not record_html or record_html == NO_DATA_HTML:
+        return
+    path = _cache_path(cache_dir, cache_key(player, begin_year, end_year))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    entry = {
+        'name': player['name'],
+        'school': player['school'],
+        'position': player['position'],
+        'begin_year': begin_year,
+        'end_year': end_year,
+        'fetched_at': time.time(),
+        'sha256': content_sha256(record_html),
+        'html': record_html,
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(entry, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def evict_cache(cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """캐시 크기가 max_bytes를 넘으면 마지막 사용 시각이 오래된 항목부터 삭제. 삭제 수 반환"""
+    entries = []
+    total = 0
+    for root, _, files in os.walk(cache_dir):
+        for filename in files:
+            if not filename.endswith('.json'):
+                continue
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+# --- 3. 캐시를 거치는 수집 ---
+def scrape_with_cache(player_list, base_url, fetch_func, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL,
+                      max_bytes=DEFAULT_MAX_BYTES, cache_only=False, on_result=None):
+    """
+    캐시에 유효한 기록이 있는 선수는 건너뛰고, 나머지만 fetch_func로 수집합니다.
+
+    Args:
+        player_list (list): parse_player_input 결과.
+        base_url (str): 기록 페이지 URL (begin_year/end_year가 캐시 키에 포함됨.
+            player에 'begin_year'/'end_year'가 있으면 그 범위를 사용).
+        fetch_func (callable): (player_list, base_url, on_result=...) -> {'이름_학교': html}.
+            scrape_player_stats, scrape_player_stats_parallel, recordfetch.fetch_player_stats 등.
+        ttl (int): 유효 기간(초). None이면 만료 없음.
+        max_bytes (int): 캐시 최대 크기. 초과 시 LRU 삭제.
+        cache_only (bool): True면 네트워크/브라우저 없이 캐시만 사용 (만료된 항목도 사용).
+        on_result (callable): 선수별 완료 콜백 (player, html). 주어지면 결과를 모아두지 않습니다.
+
+    Returns:
+        dict: scrape_player_stats와 같은 {'이름_학교': html} 형태 (입력 순서 유지).
+              on_result를 넘긴 경우 빈 dict.
+    """
+    begin_year, end_year = year_range_from_url(base_url)
+
+    results = {}
+    reported = set()
+
+    def emit(player, record_html):
+        reported.add(player_key(player))
+        if on_result is not None:
+            on_result(player, record_html)
+        else:
+            results[player_key(player)] = record_html
+
+    stale = set()
+    misses = []
+    hits = 0
+    for player in player_list:
+        html, is_fresh = get_cached_record(player, *player_year_range(player, begin_year, end_year), cache_dir, ttl)
+        if html is not None and (is_fresh or cache_only):
+            emit(player, html)
+            hits += 1
+        else:
+            if html is not None:
+                stale.add(player_key(player))
+            misses.append(player)
+
+    logger.info(f"캐시 적중: {hits}/{len(player_list)}명 (만료 {len(stale)}명)")
+
+    def store_fetched(player, record_html):
+        key = player_key(player)
+        if record_html and record_html != NO_DATA_HTML:
+            put_cached_record(player, *player_year_range(player, begin_year, end_year), record_html, cache_dir)
+        elif key in stale:
+            # 재검증(재수집) 실패 시 만료된 캐시로 대체
+            logger.warning(f"{player['name']} 선수 재수집 실패, 만료된 캐시 사용.")
+            record_html, _ = get_cached_record(player, *player_year_range(player, begin_year, end_year), cache_dir, None)
+        emit(player, record_html or NO_DATA_HTML)
+
+    if misses and not cache_only:
+        fetch_func(misses, base_url, on_result=store_fetched)
+    elif misses:
+        logger.info(f"캐시 전용 모드: 캐시에 없는 {len(misses)}명은 건너뜁니다.")
+    # 수집이 없었던 실행(캐시 전용, 전부 적중)에서도 크기 제한 적용
+    removed = evict_cache(cache_dir, max_bytes)
+    if removed:
+        logger.info(f"캐시 크기 제한으로 {removed}개 항목 삭제.")
+
+    # 수집되지 못한 선수(브라우저 시작 실패, 캐시 전용 모드 등)는 실패 HTML로 채움
+    for player in player_list:
+        if player_key(player) not in reported:
+            if cache_only:
+                mark_permanent_failure(player, "캐시에 없음 (캐시 전용 모드)")
+            emit(player, NO_DATA_HTML)
+
+    if on_result is not None:
+        return {}
+    return {player_key(player): results[player_key(player)] for player in player_list}
@@ -0,0 +1,151 @@
+import re
+
+import xlsxwriter
+
+from .recordparse import player_key
+from .recordstore import SEASON_HEADERS, iter_player_records, season_column, stat_headers
+
+# 파싱된 기록 행을 xlsxwriter로 바로 스트리밍하는 Excel 내보내기.
+# DataFrame이나 openpyxl 워크북을 만들지 않고, 기록 dict(make_player_record / iter_player_records)를 한 행씩 씁니다.
+
+# 롱 포맷 시트 이름과 키 컬럼
+LONG_SHEET_NAME = "기록"
+KEY_COLUMNS = ('이름', '학교', '포지션', '시즌')
+
+# 내보내기 레이아웃: 롱 포맷 시트 하나 / 선수별 시트 / 둘 다
+LAYOUTS = ('long', 'sheets', 'both')
+
+# Excel 시트 이름 제한
+SHEET_NAME_MAX = 31
+_INVALID_SHEET_CHARS = re.compile(r"[\\/*?:\[\]]")
+
+
+# --- 1. 시트 이름 ---
+def unique_sheet_name(name, used):
+    """
+    Excel에서 쓸 수 있고 이미 쓴 이름(used, 소문자 집합)과 겹치지 않는 시트 이름을 만듭니다.
+    31자로 잘려 같아지는 이름은 끝에 ' (2)', ' (3)'...을 붙여 구분합니다.
+    """
+    base = _INVALID_SHEET_CHARS.sub('_', name).strip("'") or "시트"
+    candidate = base[:SHEET_NAME_MAX]
+    n = 1
+    while candidate.lower() in used:
+        n += 1
+        suffix = f" ({n})"
+        candidate = base[:SHEET_NAME_MAX - len(suffix)] + suffix
+    used.add(candidate.lower())
+    return candidate
+
+
+# --- 2. 롱 포맷 컬럼 ---
+def long_columns(header_sets):
+    """
+    여러 헤더 구성(투수/타자)의 기록 컬럼을 처음 나온 순서대로 합칩니다.
+    시즌 컬럼은 키 컬럼 '시즌'으로 옮기므로 제외합니다.
+    """
+    columns = {}
+    for headers in header_sets:
+        for header in headers:
+            if header not in SEASON_HEADERS:
+                columns.setdefault(header, len(columns))
+    return list(columns)
+
+
+def _row_layout(headers, columns):
+    """헤더 구성별로 (시즌 위치, [(롱 포맷 컬럼 위치, 행 안의 위치), ...])"""
+    position = {column: i for i, column in enumerate(columns)}
+    season_index = season_column(headers)
+    cells = [(position[header], i) for i, header in enumerate(headers) if header in position]
+    return season_index, cells
+
+
+# --- 3. 쓰기 ---
+def _write_long_rows(worksheet, start_row, record, layout):
+    season_index, cells = layout
+    row_no = start_row
+    identity = [record['name'], record['school'], record['position']]
+    width = len(KEY_COLUMNS)
+    for row in record['rows']:
+        worksheet.write_row(row_no, 0, identity + [row[season_index] if season_index < len(row) else ''])
+        for column, i in cells:
+            if i < len(row) and row[i] != '':
+                worksheet.write(row_no, width + column, row[i])
+        row_no += 1
+    return row_no
+
+
+def _write_player_sheet(workbook, sheet_name, record, header_format):
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, record['headers'], header_format)
+    for row_no, row in enumerate(record['rows'], start=1):
+        worksheet.write_row(row_no, 0, row)
+    worksheet.freeze_panes(1, 0)
+
+
+def export_records(records, filename, layout='long', columns=None):
+    """
+    파싱된 기록을 Excel 파일로 저장합니다.
+
+    Args:
+        records (iterable): 기록 dict들 (extract_player_records의 값, iter_player_records 등).
+            롱 포맷에서 columns를 주면 한 번만 훑으므로 제너레이터를 그대로 넘겨도 됩니다.
+        filename (str): 저장할 Excel 파일 경로.
+        layout (str): 'long'이면 (이름, 학교, 포지션, 시즌) + 기록 컬럼의 시트 하나,
+            'sheets'면 선수별 시트, 'both'면 둘 다.
+        columns (list): 롱 포맷의 기록 컬럼 (None이면 records의 헤더를 모아서 만듦).
+
+    'long'은 constant_memory 모드로 행을 바로 임시 파일에 흘려보내 선수 수와 관계없이 메모리가 일정합니다.
+    선수별 시트가 있으면 시트마다 임시 파일 핸들이 열리므로 constant_memory를 쓰지 않습니다.
+
+    Returns:
+        int: 기록이 있어 저장된 선수 수.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout은 {', '.join(LAYOUTS)} 중 하나여야 합니다: {layout}")
+    with_long = layout in ('long', 'both')
+    with_sheets = layout in ('sheets', 'both')
+    if with_long and columns is None:
+        records = [record for record in records if record['headers'] is not None]
+        columns = long_columns(dict.fromkeys(record['headers'] for record in records))
+
+    workbook = xlsxwriter.Workbook(filename, {
+        'constant_memory': not with_sheets,
+        'strings_to_numbers': True,  # '2.45', '112' 같은 기록 값을 숫자 셀로
+    })
+    header_format = workbook.add_format({'bold': True})
+    long_sheet = None
+    if with_long:
+        long_sheet = workbook.add_worksheet(LONG_SHEET_NAME)
+        long_sheet.write_row(0, 0, list(KEY_COLUMNS) + columns, header_format)
+        long_sheet.freeze_panes(1, len(KEY_COLUMNS))
+
+    used_names = {LONG_SHEET_NAME.lower()} if with_long else set()
+    layouts = {}
+    next_row = 1
+    written = 0
+    try:
+        for record in records:
+            if record['headers'] is None:
+                continue
+            if long_sheet is not None:
+                layout_key = record['headers']
+                if layout_key not in layouts:
+                    layouts[layout_key] = _row_layout(record['headers'], columns)
+                next_row = _write_long_rows(long_sheet, next_row, record, layouts[layout_key])
+            if with_sheets:
+                _write_player_sheet(workbook, unique_sheet_name(player_key(record), used_names), record, header_format)
+            written += 1
+        if long_sheet is not None:
+            long_sheet.autofilter(0, 0, max(next_row - 1, 0), len(KEY_COLUMNS) + len(columns) - 1)
+    finally:
+        workbook.close()
+    return written
+
+
+def export_store(conn, filename, player_list=None, layout='long'):
+    """
+    결과 저장소의 기록을 선수 한 명씩 읽어 바로 Excel로 씁니다 (export_records 참고).
+    롱 포맷 컬럼은 저장소의 헤더 목록에서 미리 구하므로 전체 기록을 메모리에 올리지 않습니다.
+    """
+    columns = long_columns(stat_headers(conn)) if layout in ('long', 'both') else None
+    return export_records(iter_player_records(conn, player_list), filename, layout, columns)
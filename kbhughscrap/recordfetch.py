@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import aiohttp
+import lxml.html
+
+from .recordparse import NO_DATA_HTML, build_record_url, mark_permanent_failure, player_key
+from .tracing import logger, record_player_time
+
+# 포지션별 #Record 하위 div 위치 (scrape_player_stats의 record_xpath와 동일)
+RECORD_DIV_INDEX_BY_POSITION = {'타자': 1, '투수': 0}
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+}
+
+
+# --- 1. 응답 HTML에서 기록 섹션 추출 ---
+def extract_record_section(page_html, position):
+    """
+    기록 페이지 HTML에서 포지션에 맞는 #Record 하위 div의 outerHTML을 반환합니다.
+    (Selenium 경로의 get_attribute('outerHTML')과 같은 내용) 없으면 빈 문자열.
+    """
+    try:
+        root = lxml.html.document_fromstring(page_html)
+    except Exception:
+        return ""
+    sections = root.xpath("//*[@id='Record']/div")
+    index = RECORD_DIV_INDEX_BY_POSITION.get(position, 0)
+    if index >= len(sections):
+        return ""
+    return lxml.html.tostring(sections[index], encoding='unicode', with_tail=False)
+
+
+# --- 2. 비동기 HTTP 수집 ---
+async def fetch_record_html(session, player, base_url):
+    """
+    한 선수의 기록 섹션 HTML을 HTTP 요청 한 번으로 가져옵니다.
+    player에 'club_idx'와 'person_no'가 있어야 하며, 실패 시 빈 문자열을 반환하고
+    실패 사유를 player['error']에 남깁니다.
+    """
+    player.pop('error', None)
+    if not player.get('club_idx') or not player.get('person_no'):
+        logger.warning(f"경고: {player['name']} ({player['school']}) 선수의 club_idx/person_no가 없어 HTTP 수집을 건너뜁니다.")
+        mark_permanent_failure(player, "club_idx/person_no 없음")
+        return ""
+
+    url = build_record_url(base_url, player['club_idx'], player['person_no'], player['position'],
+                           player.get('begin_year'), player.get('end_year'))
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                logger.warning(f"오류: {player['name']} 선수 기록 요청 실패 (HTTP {response.status}, {url})")
+                player['error'] = f"HTTP {response.status}"
+                return ""
+            page_html = await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f"오류: {player['name']} 선수 기록 요청 중 오류 발생: {e}")
+        player['error'] = f"요청 오류: {e!r}"
+        return ""
+
+    record_html = extract_record_section(page_html, player['position'])
+    if record_html:
+        logger.debug(f"  {player['name']} 선수 기록 섹션 추출 성공 (길이: {len(record_html)} 문자).")
+    else:
+        logger.warning(f"오류: {player['name']} 선수 응답에서 기록 섹션(#Record)을 찾을 수 없습니다.")
+        player['error'] = "기록 섹션 없음"
+    return record_html
+
+
+async def fetch_player_records_async(player_list, base_url, concurrency=8, timeout=15, on_result=None):
+    """
+    keep-alive 커넥션 풀을 공유하는 aiohttp 세션 하나로 선수 기록을 동시에 수집합니다.
+    결과는 scrape_player_stats와 같은 {'이름_학교': html} 형태이며 입력 순서를 따릅니다.
+    on_result(player, html)를 넘기면 선수별로 끝나는 즉시 호출하고 결과를 모아두지 않습니다.
+    """
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout, headers=DEFAULT_HEADERS) as session:
+        async def fetch_one(player):
+            # 한 선수의 예기치 않은 오류(디코딩 실패, on_result 오류 등)가 나머지 수집을 취소하지 않도록 선수 단위로 처리
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    record_html = await fetch_record_html(session, player, base_url)
+                except Exception as e:
+                    logger.warning(f"{player['name']} 선수 기록 수집 중 예기치 않은 오류 발생: {e!r}")
+                    player['error'] = f"예기치 않은 오류: {e!r}"
+                    record_html = ""
+                record_player_time(player, time.perf_counter() - start, bool(record_html))
+            if on_result is not None:
+                try:
+                    on_result(player, record_html or NO_DATA_HTML)
+                except Exception as e:
+                    # 보고되지 않은 선수는 run_jobs가 실패로 기록하고 다시 시도함
+                    logger.warning(f"{player['name']} 선수 결과 처리 중 오류 발생: {e!r}")
+                return None
+            return record_html
+
+        record_htmls = await asyncio.gather(*(fetch_one(player) for player in player_list))
+
+    if on_result is not None:
+        return {}
+    all_player_data = {}
+    for player, record_html in zip(player_list, record_htmls):
+        all_player_data[player_key(player)] = record_html or NO_DATA_HTML
+    return all_player_data
+
+
+def fetch_player_stats(player_list, base_url, concurrency=8, timeout=15, on_result=None):
+    """브라우저 없이 HTTP로 선수 기록을 수집 (fetch_player_records_async의 동기 래퍼)"""
+    if not player_list:
+        return {}
+    logger.info(f"HTTP 직접 수집 시작 ({len(player_list)}명, 동시 요청 {concurrency}개)...")
+    all_player_data = asyncio.run(fetch_player_records_async(player_list, base_url, concurrency, timeout, on_result))
+    logger.info("\n모든 선수 HTTP 수집 완료.")
+    return all_player_data
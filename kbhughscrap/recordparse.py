@@ -0,0 +1,169 @@
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import lxml.html
+
+from .tracing import logger
+
+# 기록 페이지 URL, 기록 HTML 파싱과 Excel 저장 (브라우저 없이 쓰는 부분이라 selenium/pandas를 바로 불러오지 않음)
+
+# 추출 실패 시 저장되는 HTML
+NO_DATA_HTML = "<h1>데이터 없음 또는 추출 실패</h1>"
+
+# 포지션별 record_type 쿼리 값 (기록 페이지의 '타자'/'투수' 탭 순서와 동일)
+RECORD_TYPE_BY_POSITION = {'타자': '1', '투수': '2'}
+
+
+def player_key(player):
+    """결과 dict에서 사용하는 선수 키 ('이름_학교')"""
+    return f"{player['name']}_{player['school']}"
+
+
+def content_sha256(record_html):
+    """기록 HTML의 SHA-256 (캐시 무결성 확인과 저장소의 변경 여부 비교에 사용)"""
+    return hashlib.sha256(record_html.encode('utf-8')).hexdigest()
+
+
+def mark_permanent_failure(player, reason):
+    """
+    다시 시도해도 성공할 수 없는 실패(목록에 없는 학교, ID 없음, 캐시 전용 모드의 캐시 누락 등)를 기록합니다.
+    jobjournal.run_jobs는 이런 선수를 재시도하지 않습니다.
+    """
+    player['error'] = reason
+    player['retry'] = False
+
+
+def build_record_url(base_url, club_idx, person_no, position=None, begin_year=None, end_year=None):
+    """
+    base_url의 쿼리 파라미터 중 club_idx, person_no, record_type, begin_year, end_year를
+    채워 넣은 기록 페이지 URL을 반환합니다. (나머지 파라미터와 순서는 유지)
+    """
+    overrides = {'club_idx': str(club_idx), 'person_no': str(person_no)}
+    if position in RECORD_TYPE_BY_POSITION:
+        overrides['record_type'] = RECORD_TYPE_BY_POSITION[position]
+    if begin_year is not None:
+        overrides['begin_year'] = str(begin_year)
+    if end_year is not None:
+        overrides['end_year'] = str(end_year)
+
+    parts = urlsplit(base_url)
+    query = []
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        query.append((key, overrides.pop(key, value)))
+    query.extend(overrides.items())
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+# --- 1. 기록 HTML 파싱 (한 번만 파싱하여 행 데이터로 변환) ---
+
+# profile_view div를 찾는 XPath (class 속성에 'profile_view'가 포함된 div)
+profile_view_xpath = "descendant-or-self::div[contains(concat(' ', normalize-space(@class), ' '), ' profile_view ')]"
+
+# 같은 헤더 구성은 하나의 튜플을 공유하도록 캐시 (투수/타자 헤더가 반복되므로)
+_shared_headers = {}
+
+
+def parse_record_html(record_html):
+    """
+    기록 섹션 HTML에서 profile_view의 <li>/<span>을 읽어 (headers, rows)로 변환합니다.
+    첫 번째 <li>가 헤더이고 나머지가 데이터 행입니다. 기록이 없으면 (None, []).
+
+    Returns:
+        tuple: (헤더 문자열 튜플, [행 문자열 튜플, ...])
+    """
+    if not record_html:
+        return None, []
+    try:
+        root = lxml.html.fragment_fromstring(record_html, create_parent='div')
+    except Exception:
+        return None, []
+    profile_views = root.xpath(profile_view_xpath)
+    if not profile_views:
+        return None, []
+
+    items = profile_views[0].iter('li')
+    header_li = next(items, None)
+    if header_li is None:
+        return None, []
+    headers = tuple(span.text_content().strip() for span in header_li.iter('span'))
+    headers = _shared_headers.setdefault(headers, headers)
+    rows = [tuple(span.text_content().strip() for span in li.iter('span')) for li in items]
+    return headers, rows
+
+
+def make_player_record(player, record_html):
+    """선수 정보와 기록 HTML로 파싱된 기록 dict를 만듦 (HTML은 보관하지 않음)"""
+    headers, rows = parse_record_html(record_html)
+    return {
+        'name': player['name'],
+        'school': player['school'],
+        'position': player['position'],
+        'headers': headers,
+        'rows': rows,
+    }
+
+
+def extract_player_records(player_list, data_dict):
+    """
+    수집 결과 {'이름_학교': html}를 {'이름_학교': 기록 dict}로 변환합니다.
+    파싱이 끝난 HTML은 data_dict에서 바로 제거하여 메모리에서 내립니다.
+    """
+    player_records = {}
+    for player in player_list:
+        key = player_key(player)
+        player_records[key] = make_player_record(player, data_dict.pop(key, ""))
+    return player_records
+
+
+def record_to_dataframe(record):
+    """기록 dict를 표시/저장용 DataFrame으로 변환 (기록이 없으면 None)"""
+    if record['headers'] is None:
+        return None
+    import pandas as pd
+    return pd.DataFrame(record['rows'], columns=list(record['headers']))
+
+
+def format_player_record(record):
+    """파싱된 기록을 보기 좋은 표 형태의 문자열로 변환"""
+    try:
+        df = record_to_dataframe(record)
+        if df is None:
+            return f"{record['name']} 선수의 기록 섹션을 찾을 수 없습니다."
+        return f"\n{record['name']} 선수의 기록 (표 형태):\n{df.to_string(index=False)}"
+    except Exception as e:
+        return f"{record['name']} 선수의 기록을 표 형태로 변환 중 오류 발생: {e}"
+
+
+def print_player_record(record):
+    """파싱된 기록을 보기 좋은 표 형태로 출력"""
+    print(format_player_record(record))
+
+
+# --- 2. Excel 파일로 저장 (선수별 시트, recordexport로 스트리밍) ---
+def save_to_excel(data_dict, filename="kbo_player_stats_final.xlsx", layout='sheets'):
+    """
+    파싱된 기록을 Excel 파일로 저장 (기본: 선수별 시트, 표 형태 데이터)
+
+    Args:
+        data_dict (dict): extract_player_records 결과 {'이름_학교': 기록 dict}.
+            이전처럼 {'이름_학교': html}을 넘기면 여기서 파싱합니다.
+        layout (str): 'sheets'(선수별 시트), 'long'(롱 포맷 시트 하나), 'both'. recordexport.export_records 참고.
+    """
+    if not data_dict:
+        logger.warning("저장할 데이터가 없습니다.")
+        return
+
+    from .recordexport import export_records
+
+    def records():
+        for key, record in data_dict.items():
+            if isinstance(record, str):
+                name, _, school = key.partition('_')
+                record = make_player_record({'name': name, 'school': school, 'position': ''}, record)
+            yield record
+
+    try:
+        written = export_records(records(), filename, layout)
+        logger.info(f"\n{written}명의 기록을 성공적으로 '{filename}' 파일에 저장했습니다.")
+    except Exception as e:
+        logger.error(f"Excel 파일 저장 중 오류 발생: {e}")
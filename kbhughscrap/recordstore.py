@@ -0,0 +1,314 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from .recordparse import content_sha256, format_player_record, make_player_record
+from .tracing import STAGE_PARSE, STAGE_WRITE, logger, span
+
+# 결과 저장소 기본 경로
+DEFAULT_STORE_PATH = "kbo_player_stats.sqlite"
+
+# 시즌(연도) 컬럼으로 인식하는 헤더 이름
+SEASON_HEADERS = ('연도', '년도', '시즌', 'YEAR', 'Year')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name        TEXT NOT NULL,
+    school      TEXT NOT NULL,
+    position    TEXT NOT NULL,
+    headers     TEXT NOT NULL,
+    begin_year  TEXT,
+    end_year    TEXT,
+    updated_at  REAL NOT NULL,
+    content_sha256 TEXT,
+    PRIMARY KEY (name, school, position)
+);
+CREATE TABLE IF NOT EXISTS record_stats (
+    name        TEXT NOT NULL,
+    school      TEXT NOT NULL,
+    position    TEXT NOT NULL,
+    season      TEXT NOT NULL,
+    row_no      INTEGER NOT NULL,
+    stat        TEXT NOT NULL,
+    value       TEXT,
+    PRIMARY KEY (name, school, position, row_no, stat)
+);
+CREATE INDEX IF NOT EXISTS idx_record_stats_season ON record_stats (season, position, stat);
+"""
+
+
+# --- 1. 저장소 열기 ---
+def open_record_store(path=DEFAULT_STORE_PATH):
+    """
+    SQLite 결과 저장소를 열고 스키마를 준비합니다.
+
+    테이블:
+        players      (name, school, position) 별 헤더 순서와 수집 정보 (content_sha256: 마지막으로 저장한 응답의 해시)
+        record_stats (name, school, position, season, row_no, stat, value) 롱 포맷 기록
+    """
+    conn = sqlite3.connect(path, check_same_thread=False)
+    # WAL: 선수 단위 커밋이 빠르고, 중간에 죽어도 커밋된 선수는 남음
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    # 이전 버전에서 만든 저장소에는 content_sha256 컬럼이 없음
+    if 'content_sha256' not in {row[1] for row in conn.execute("PRAGMA table_info(players)")}:
+        conn.execute("ALTER TABLE players ADD COLUMN content_sha256 TEXT")
+    return conn
+
+
+def season_column(headers):
+    """헤더에서 시즌 컬럼 위치를 찾음 (없으면 첫 번째 컬럼)"""
+    for i, header in enumerate(headers):
+        if header in SEASON_HEADERS:
+            return i
+    return 0
+
+
+# --- 2. 쓰기 ---
+def _season_order(season):
+    """시즌 정렬 키: 연도 행은 연도순, 그 외(통산 등)는 뒤에 원래 순서대로"""
+    return (0, int(season)) if season.isdigit() else (1, 0)
+
+
+def merge_season_rows(old_rows, new_rows, season_index, begin_year, end_year):
+    """
+    기존 행에 새로 받은 시즌 행을 합칩니다.
+    연도 행만 교체 대상입니다: 새 행과 연도가 같은 기존 행, 그리고 이번에 요청한 연도 범위 안의 기존 행은 새 행으로 교체됩니다.
+    통산 등 연도가 아닌 행은 기존 것을 유지합니다 (일부 연도만 받은 응답의 통산은 그 범위의 합계일 뿐이므로).
+    """
+    def season_of(row):
+        return row[season_index] if season_index < len(row) else ''
+
+    new_years = [row for row in new_rows if season_of(row).isdigit()]
+    new_seasons = {season_of(row) for row in new_years}
+    begin, end = int(begin_year), int(end_year)
+
+    def replaced(season):
+        return season.isdigit() and (season in new_seasons or begin <= int(season) <= end)
+
+    merged = [row for row in old_rows if not replaced(season_of(row))] + new_years
+    merged.sort(key=lambda row: _season_order(season_of(row)))
+    return merged
+
+
+def _merged_year_range(conn, player_id, begin_year, end_year):
+    """저장된 수집 범위와 이번 범위를 합친 (begin_year, end_year)"""
+    row = conn.execute(
+        "SELECT begin_year, end_year FROM players WHERE name = ? AND school = ? AND position = ?", player_id
+    ).fetchone()
+    if row is None or not all(str(year).isdigit() for year in (row[0], row[1], begin_year, end_year)):
+        return begin_year, end_year
+    return str(min(int(row[0]), int(begin_year))), str(max(int(row[1]), int(end_year)))
+
+
+def write_player_record(conn, record, begin_year='', end_year='', merge=False, content_sha256=None):
+    """
+    파싱된 기록 dict 하나를 저장합니다. 같은 선수의 기존 행은 교체됩니다.
+    merge=True면 (증분 갱신) begin_year~end_year 시즌 행만 교체하고 나머지 시즌은 유지합니다.
+    content_sha256은 원본 응답의 해시로, 다음에 같은 응답이 오면 store_sink가 다시 쓰지 않습니다.
+    기록이 없는(추출 실패) 경우에는 기존 데이터를 지우지 않고 False를 반환합니다.
+    """
+    headers = record['headers']
+    if headers is None:
+        return False
+
+    player_id = (record['name'], record['school'], record['position'])
+    season_index = season_column(headers)
+    rows = record['rows']
+    if merge:
+        existing = next(iter_player_records(conn, [record]), None)
+        if existing is not None and existing['headers'] == tuple(headers):
+            rows = merge_season_rows(existing['rows'], rows, season_index, begin_year, end_year)
+            begin_year, end_year = _merged_year_range(conn, player_id, begin_year, end_year)
+        elif existing is not None:
+            # 헤더 구성이 바뀌어 합칠 수 없음: 받은 범위로 교체 (다음 갱신에서 이전 시즌부터 다시 받음)
+            logger.warning(f"{record['name']} 선수의 기록 헤더가 바뀌어 기존 시즌과 합치지 않고 교체합니다.")
+
+    stat_rows = []
+    for row_no, row in enumerate(rows):
+        season = row[season_index] if season_index < len(row) else ''
+        for stat, value in zip(headers, row):
+            stat_rows.append(player_id + (season, row_no, stat, value))
+
+    with conn:
+        conn.execute("DELETE FROM record_stats WHERE name = ? AND school = ? AND position = ?", player_id)
+        conn.executemany("INSERT OR REPLACE INTO record_stats VALUES (?, ?, ?, ?, ?, ?, ?)", stat_rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO players"
+            " (name, school, position, headers, begin_year, end_year, updated_at, content_sha256)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            player_id + (json.dumps(headers, ensure_ascii=False), begin_year, end_year, time.time(), content_sha256),
+        )
+    return True
+
+
+def stored_content_sha256(conn, player):
+    """마지막으로 저장한 응답의 해시 (없으면 None)"""
+    row = conn.execute(
+        "SELECT content_sha256 FROM players WHERE name = ? AND school = ? AND position = ?",
+        (player['name'], player['school'], player['position']),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def store_sink(conn, begin_year='', end_year='', show=True):
+    """
+    on_result 콜백으로 쓸 수 있는 저장 함수를 반환합니다.
+    선수 한 명이 끝날 때마다 HTML을 파싱하고 바로 저장한 뒤 버리므로,
+    배치 크기와 상관없이 메모리 사용량이 일정합니다. (여러 스레드에서 호출 가능)
+    show=True면 선수별 기록 표를 로그 수준 DEBUG로 출력합니다.
+    응답(과 요청 연도 범위)이 마지막으로 저장한 것과 같으면 파싱과 쓰기를 건너뜁니다.
+    """
+    lock = threading.Lock()
+
+    def on_result(player, record_html):
+        player_begin, player_end = player.get('begin_year', begin_year), player.get('end_year', end_year)
+        digest = content_sha256(f"{player_begin}\x1f{player_end}\x1f{record_html}")
+        with lock:
+            unchanged = stored_content_sha256(conn, player) == digest
+        if unchanged:
+            logger.debug(f"{player['name']} 선수 기록 변경 없음, 저장 생략.")
+            return
+        with span(STAGE_PARSE, player):
+            record = make_player_record(player, record_html)
+        if show and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(format_player_record(record))
+        with lock, span(STAGE_WRITE, player) as trace:
+            # 증분 갱신 대상은 player에 지정된 연도 범위만 교체
+            trace['ok'] = write_player_record(
+                conn, record, player_begin, player_end,
+                merge=player.get('incremental', False), content_sha256=digest,
+            )
+            if not trace['ok']:
+                logger.warning(f"{player['name']} 선수는 저장할 기록이 없어 건너뜁니다.")
+
+    return on_result
+
+
+# --- 3. 증분 갱신 ---
+def _has_summary_rows(conn, player):
+    """저장된 기록에 연도가 아닌 행(통산 등)이 있는지"""
+    return conn.execute(
+        "SELECT 1 FROM record_stats WHERE name = ? AND school = ? AND position = ? AND season NOT GLOB '[0-9]*' LIMIT 1",
+        (player['name'], player['school'], player['position']),
+    ).fetchone() is not None
+
+
+def plan_incremental_refresh(conn, player_list, begin_year, end_year):
+    """
+    저장소에 기록된 선수별 마지막 수집 시즌을 보고 다시 받아야 할 시즌만 남깁니다.
+
+    수집 당시 이미 끝난 시즌(수집 연도 이전 시즌)은 닫힌 시즌으로 보고 다시 받지 않으며,
+    그 다음 시즌부터 end_year까지만 player['begin_year']/['end_year']에 지정하고
+    player['incremental']=True로 표시합니다 (저장 시 기존 시즌과 합침).
+    저장소에 없거나 club_idx/person_no를 모르는 선수는 전체 범위를 그대로 받습니다.
+    통산 등 연도가 아닌 행이 저장된 선수는 새 시즌만 받으면 합계를 맞출 수 없으므로,
+    받을 시즌이 있으면 저장된 범위까지 포함한 전체 범위를 다시 받아 교체합니다.
+
+    Returns:
+        list: 이번에 수집해야 할 선수 리스트 (입력 순서). 닫힌 시즌만 남은 선수는 제외됩니다.
+    """
+    if not (str(begin_year).isdigit() and str(end_year).isdigit()):
+        return list(player_list)
+
+    to_fetch = []
+    for player in player_list:
+        row = conn.execute(
+            "SELECT begin_year, end_year, updated_at FROM players WHERE name = ? AND school = ? AND position = ?",
+            (player['name'], player['school'], player['position']),
+        ).fetchone()
+        if row is None or not str(row[1]).isdigit() or not (player.get('club_idx') and player.get('person_no')):
+            to_fetch.append(player)
+            continue
+
+        closed_through = min(int(row[1]), time.localtime(row[2]).tm_year - 1)
+        delta_begin = max(closed_through + 1, int(begin_year))
+        if delta_begin > int(end_year):
+            continue
+        if _has_summary_rows(conn, player):
+            stored_begin = int(row[0]) if str(row[0]).isdigit() else int(begin_year)
+            player['begin_year'] = str(min(stored_begin, int(begin_year)))
+            player['end_year'] = str(end_year)
+        else:
+            player['begin_year'] = str(delta_begin)
+            player['end_year'] = str(end_year)
+            player['incremental'] = True
+        to_fetch.append(player)
+    return to_fetch
+
+
+# --- 4. 읽기 ---
+def iter_player_records(conn, player_list=None):
+    """
+    저장된 기록을 기록 dict (extract_player_records와 같은 형태)로 하나씩 돌려줍니다.
+    player_list를 주면 그 선수들만, 입력 순서대로 읽습니다.
+    """
+    if player_list is None:
+        player_ids = conn.execute("SELECT name, school, position FROM players ORDER BY rowid").fetchall()
+    else:
+        player_ids = [(player['name'], player['school'], player['position']) for player in player_list]
+
+    for player_id in player_ids:
+        row = conn.execute(
+            "SELECT headers FROM players WHERE name = ? AND school = ? AND position = ?", player_id
+        ).fetchone()
+        if row is None:
+            continue
+        headers = tuple(json.loads(row[0]))
+        column = {header: i for i, header in enumerate(headers)}
+        rows = {}
+        for row_no, stat, value in conn.execute(
+            "SELECT row_no, stat, value FROM record_stats"
+            " WHERE name = ? AND school = ? AND position = ? ORDER BY row_no",
+            player_id,
+        ):
+            values = rows.setdefault(row_no, [''] * len(headers))
+            if stat in column:
+                values[column[stat]] = value
+        yield {
+            'name': player_id[0],
+            'school': player_id[1],
+            'position': player_id[2],
+            'headers': headers,
+            'rows': [tuple(values) for _, values in sorted(rows.items())],
+        }
+
+
+def stat_headers(conn):
+    """저장된 선수들의 헤더 구성 목록 (투수/타자 등, 처음 저장된 순서)"""
+    header_sets = {}
+    for (headers,) in conn.execute("SELECT headers FROM players ORDER BY rowid"):
+        header_sets.setdefault(headers, tuple(json.loads(headers)))
+    return list(header_sets.values())
+
+
+def store_summary(conn, top_schools=10):
+    """
+    저장소 요약 통계를 반환합니다.
+    {'players', 'rows', 'first_season', 'last_season', 'by_position': {포지션: 인원}, 'top_schools': [(학교, 인원), ...]}
+    """
+    players = conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+    rows = conn.execute(
+        "SELECT COUNT(*) FROM (SELECT DISTINCT name, school, position, row_no FROM record_stats)"
+    ).fetchone()[0]
+    # 통산 등 연도가 아닌 행은 시즌 범위에서 제외 (텍스트 비교라 '통산'이 최대값이 됨)
+    first_season, last_season = conn.execute(
+        "SELECT MIN(season), MAX(season) FROM record_stats WHERE season GLOB '[0-9]*'"
+    ).fetchone()
+    by_position = dict(conn.execute(
+        "SELECT position, COUNT(*) FROM players GROUP BY position ORDER BY COUNT(*) DESC"
+    ).fetchall())
+    schools = conn.execute(
+        "SELECT school, COUNT(*) FROM players GROUP BY school ORDER BY COUNT(*) DESC, school LIMIT ?", (top_schools,)
+    ).fetchall()
+    return {
+        'players': players,
+        'rows': rows,
+        'first_season': first_season,
+        'last_season': last_season,
+        'by_position': by_position,
+        'top_schools': [tuple(row) for row in schools],
+    }
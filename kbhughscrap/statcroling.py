@@ -0,0 +1,750 @@
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException, StaleElementReferenceException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from webdriver_manager.chrome import ChromeDriverManager
+
+from .domquery import ACTIVE_OPTIONS_XPATH, build_option_map, click_option, core_text, read_outer_html
+from .playertext import iter_roster_players
+from .recordcache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, DEFAULT_TTL
+# 기록 URL/파싱/저장 함수는 recordparse로 옮겼지만 기존 호출부를 위해 여기서도 제공
+from .recordparse import (
+    NO_DATA_HTML, RECORD_TYPE_BY_POSITION, build_record_url, extract_player_records, make_player_record,
+    mark_permanent_failure, parse_record_html, player_key, print_player_record, record_to_dataframe, save_to_excel,
+)
+from .tracing import (
+    PLAYER_STAGE, STAGE_BROWSER_START, STAGE_EXTRACT, STAGE_PAGE_LOAD, STAGE_PLAYER_SELECT, STAGE_POSITION_CLICK,
+    STAGE_SCHOOL_SELECT, STAGE_SEARCH_CLICK, close_tracing, configure_tracing, logger, print_trace_summary,
+    reset_traces, span, trace_player,
+)
+from .waitengine import (
+    POLL_FREQUENCY, dropdown_open, options_populated, record_changed, record_snapshot, wait_for,
+)
+
+# --- 1. 입력 데이터 파싱 (포지션 일반화 포함) ---
+def parse_player_input(input_text):
+    """
+    사용자 입력을 파싱하여 선수 정보 리스트 생성
+    ('이름 (학교, 포지션)' 외에 드래프트 원문 형식도 playertext.iter_roster_players로 바로 처리)
+    """
+    skipped = []
+    # 입력된 이름/학교가 li 태그 텍스트와 정확히 일치해야 함 (필요시 여기서 정제)
+    players = list(iter_roster_players(input_text, skipped))
+    for line, _ in skipped:
+        logger.warning(f"경고: 입력 형식 오류 - '{line}'")
+    return players
+
+# --- Helper Function: 드롭다운 옵션(<li>) 선택 (핵심 텍스트 비교) ---
+def select_dropdown_option(driver, wait, dropdown_trigger_xpath, target_text, options_li_xpath, item_type="항목"):
+    """
+    드롭다운을 클릭하고, 표시된 <li> 옵션에서 핵심 텍스트가 일치하는 항목을
+    찾아 스크롤 후 선택합니다. (괄호 안 내용 무시)
+    **로그 수준이 DEBUG이면 디버깅을 위해 모든 옵션 텍스트를 출력합니다.**
+
+    Returns:
+        성공하면 True, 옵션 목록에 target_text가 없으면 None (다시 시도해도 소용없음), 그 밖의 실패는 False.
+    """
+    logger.debug(f"{item_type} 드롭다운 클릭 시도 (Trigger: {dropdown_trigger_xpath})...")
+    try:
+        trigger = wait_for(driver, EC.element_to_be_clickable((By.XPATH, dropdown_trigger_xpath)), f"{item_type} 드롭다운")
+        driver.execute_script("arguments[0].scrollIntoViewIfNeeded(true);", trigger)
+        driver.execute_script("arguments[0].click();", trigger)
+        # 고정 sleep 대신 'abs_select on' 클래스가 붙을 때까지만 대기
+        wait_for(driver, dropdown_open, f"{item_type} 드롭다운 열림")
+        logger.debug(f"{item_type} 드롭다운 클릭 성공.")
+    except TimeoutException:
+        logger.warning(f"오류: {item_type} 드롭다운({dropdown_trigger_xpath})을 시간 내에 찾거나 클릭할 수 없습니다.")
+        return False
+    except Exception as e:
+        logger.warning(f"{item_type} 드롭다운 클릭 중 오류: {e}")
+        return False
+
+    logger.debug(f"'{target_text}' {item_type} 검색 및 선택 시도 (Options XPath: {options_li_xpath})...")
+    placeholder = item_type + "명"
+    try:
+        # 기본 옵션("학교명", "선수명")이 아닌 실제 옵션이 채워질 때까지 대기.
+        # 조건이 옵션 전체 텍스트를 스크립트 한 번으로 읽어 오므로 <li>마다 .text를 읽지 않음
+        options = wait_for(driver, options_populated(placeholder, options_li_xpath), f"{item_type} 옵션 로딩", retries=1)
+        logger.debug(f"  검색 대상 {item_type} 옵션 <li> {len(options)}개 발견.")
+        # ★★★ 디버깅 출력: 모든 옵션의 전체 텍스트와 추출된 핵심 텍스트 (DEBUG일 때만 만들고 출력) ★★★
+        show_options = logger.isEnabledFor(logging.DEBUG)
+        all_options_texts = [
+            f"[{i+1:02d}] Full: '{option_full_text}' || Core: '{core_text(option_full_text)}'"
+            for i, (option_full_text, _) in enumerate(options)
+        ] if show_options else []
+        if show_options:
+            logger.debug("-" * 30) # 구분선
+            for txt in all_options_texts:
+                logger.debug(f"  {txt}")
+            logger.debug("-" * 30) # 구분선
+
+        # 핵심 텍스트(괄호 앞 부분) -> 옵션 위치 맵으로 한 번에 찾음 (기본 옵션 및 빈 텍스트 제외)
+        index = build_option_map(options, placeholder).get(target_text)
+        if index is None:
+            logger.warning(f"오류: '{target_text}' {item_type} 옵션을 리스트에서 찾을 수 없습니다.")
+            if show_options:
+                logger.debug("=== 전체 옵션 리스트 (재확인) ===")
+                for txt in all_options_texts: # 저장된 전체 리스트 다시 출력
+                    logger.debug(txt)
+                logger.debug("===============================")
+            # 실패 시 드롭다운 닫기 시도
+            try:
+                 body = driver.find_element(By.TAG_NAME, 'body')
+                 body.click()
+            except: pass
+            return None
+
+        option_full_text = options[index][0]
+        logger.debug(f"  >> 일치 항목 찾음: '{option_full_text}'. 스크롤 및 클릭 시도...")
+        # 스크롤과 클릭을 스크립트 한 번으로 처리 (그 사이 목록이 바뀌면 텍스트로 다시 찾음)
+        if not click_option(driver, options_li_xpath, index, option_full_text):
+            logger.warning(f"오류: '{target_text}' {item_type}을 찾았으나 클릭에 실패했습니다.")
+            return False
+        logger.debug(f"  >> '{target_text}' {item_type} 선택 성공.")
+        return True # 최종 성공
+
+    except TimeoutException:
+         logger.warning(f"오류: {item_type} 옵션 리스트({options_li_xpath})가 시간 내에 나타나지 않았습니다.")
+         return False
+    except Exception as e:
+        logger.warning(f"{item_type} 선택 중 오류: {e}")
+        return False
+
+# --- 2. Selenium을 이용한 스크래핑 함수 (전체 레코드 추출 및 URL 수정) ---
+
+# 드롭다운 트리거 XPath (이전과 동일하게 가정)
+school_dropdown_trigger_xpath = '//*[@id="recordForm"]/div/div[3]/div[1]/div[3]'
+player_dropdown_trigger_xpath = '//*[@id="recordForm"]/div/div[3]/div[1]/div[4]'
+position_dropdown_trigger_xpath = '//*[@id="recordForm"]/div/div[3]/div[1]/div[6]'
+position_search_button_xpath = '//*[@id="recordForm"]/div/div[3]/div[1]/div[6]/a'
+
+# ★★★ 활성화된 드롭다운 내부의 <li> 옵션들을 찾는 XPath ★★★
+# 제공된 HTML 구조 기반: class 'abs_select'와 'on'을 모두 가진 div 내부의 ul 아래 li
+options_li_xpath = ACTIVE_OPTIONS_XPATH
+
+# 전체 기록 Section을 찾는 XPath
+record_container_xpath = '//*[@id="Record"]/div[2]/div/div'
+
+# 선수 한 명을 처리하는 데 걸린 전체 시간을 기록하는 단계 이름 (벤치마크 지연 시간 통계용)
+PLAYER_STEP = PLAYER_STAGE
+
+# 실행 간에 유지되는 브라우저 디스크 캐시 디렉토리
+DEFAULT_BROWSER_CACHE_DIR = "kbo_browser_cache"
+
+# 기록 추출에 필요 없어 받지 않는 리소스 (CDP Network.setBlockedURLs 패턴)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+]
+
+# 찾아 둔 chromedriver 경로 (세션마다 다시 찾지 않도록 프로세스 안에서 공유)
+_resolved_driver = {}
+_driver_path_lock = threading.Lock()
+
+
+def _cached_chromedriver_paths():
+    """webdriver_manager가 이전에 받아 둔 chromedriver 경로들 (최근 것부터)"""
+    root = os.environ.get('WDM_LOCAL_PATH') or os.path.join(os.path.expanduser('~'), '.wdm')
+    names = ('chromedriver', 'chromedriver.exe')
+    paths = [
+        os.path.join(dirpath, name)
+        for dirpath, _, filenames in os.walk(os.path.join(root, 'drivers', 'chromedriver'))
+        for name in filenames if name in names
+    ]
+    return sorted(paths, key=os.path.getmtime, reverse=True)
+
+
+def resolve_chromedriver():
+    """
+    네트워크 확인 없이 chromedriver 경로를 찾습니다.
+    CHROMEDRIVER_PATH 환경 변수 -> PATH의 chromedriver -> webdriver_manager 로컬 캐시 순서로 찾고,
+    모두 없을 때만 ChromeDriverManager().install()로 내려받습니다.
+
+    Returns:
+        tuple: (경로, 출처 설명).
+    """
+    with _driver_path_lock:
+        if 'path' in _resolved_driver:
+            return _resolved_driver['path'], _resolved_driver['source']
+
+        path, source = os.environ.get('CHROMEDRIVER_PATH'), "CHROMEDRIVER_PATH"
+        if not (path and os.path.isfile(path)):
+            path, source = shutil.which('chromedriver'), "PATH"
+        if not path:
+            cached = _cached_chromedriver_paths()
+            path, source = (cached[0], "로컬 캐시") if cached else (None, None)
+        if not path:
+            path, source = ChromeDriverManager().install(), "ChromeDriverManager 다운로드"
+
+        _resolved_driver.update(path=path, source=source)
+        return path, source
+
+
+def _lean_chrome_options(headless, cache_dir, block_resources):
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    # 시작 시간을 줄이기 위해 기본 브라우저 부가 기능을 끔
+    for argument in ('--no-first-run', '--no-default-browser-check', '--disable-extensions',
+                     '--disable-background-networking', '--disable-sync', '--mute-audio'):
+        options.add_argument(argument)
+    if cache_dir:
+        # 세션이 바뀌어도 같은 디스크 캐시를 써서 스크립트/스타일을 다시 받지 않음
+        os.makedirs(cache_dir, exist_ok=True)
+        options.add_argument(f"--disk-cache-dir={os.path.abspath(cache_dir)}")
+    if block_resources:
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    # DOMContentLoaded까지만 기다림 (필요한 요소는 wait_for 조건으로 확인)
+    options.page_load_strategy = 'eager'
+    return options
+
+
+def create_driver(headless=True, cache_dir=DEFAULT_BROWSER_CACHE_DIR, block_resources=True):
+    """
+    Chrome WebDriver와 WebDriverWait를 생성. 실패 시 (None, None) 반환
+
+    Args:
+        headless (bool): headless 모드 사용 여부 (기본값 True).
+        cache_dir (str): 실행 간에 유지되는 브라우저 디스크 캐시 디렉토리 (None이면 사용 안 함).
+            여러 세션을 동시에 띄울 때는 세션마다 다른 디렉토리를 주세요.
+        block_resources (bool): 이미지/폰트/미디어 등 기록 추출에 필요 없는 리소스를 받지 않음.
+    """
+    logger.debug("WebDriver 설정 중...")
+    start = time.perf_counter()
+    try:
+        with span(STAGE_BROWSER_START):
+            driver_path, source = resolve_chromedriver()
+            options = _lean_chrome_options(headless, cache_dir, block_resources)
+            try:
+                driver = webdriver.Chrome(service=Service(driver_path), options=options)
+            except Exception as e:
+                if source == "ChromeDriverManager 다운로드":
+                    raise
+                # 로컬 드라이버가 설치된 Chrome 버전과 맞지 않는 경우 등: 한 번만 새로 받아 재시도
+                logger.warning(f"로컬 chromedriver({source})로 시작 실패, 새로 내려받아 재시도합니다: {e}")
+                with _driver_path_lock:
+                    _resolved_driver.clear()
+                    driver_path, source = ChromeDriverManager().install(), "ChromeDriverManager 다운로드"
+                    _resolved_driver.update(path=driver_path, source=source)
+                driver = webdriver.Chrome(service=Service(driver_path), options=options)
+            if block_resources:
+                try:
+                    driver.execute_cdp_cmd('Network.enable', {})
+                    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+                except Exception as e:
+                    logger.debug(f"리소스 차단 설정 실패 (무시): {e}")
+        wait = WebDriverWait(driver, 15, poll_frequency=POLL_FREQUENCY)
+        logger.info(f"WebDriver 설정 완료 ({time.perf_counter() - start:.2f}초, 드라이버: {source}).")
+        return driver, wait
+    except Exception as e:
+        logger.warning(f"WebDriver 설정 오류: {e}")
+        return None, None
+
+
+def is_driver_alive(driver):
+    """브라우저 세션이 아직 응답하는지 확인 (크래시 감지용)"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def read_form_value(driver, field_name):
+    """recordForm의 입력값(club_idx, person_no 등)을 읽음. 없으면 빈 문자열"""
+    try:
+        value = driver.execute_script(
+            "var f = document.getElementById('recordForm');"
+            "var e = f && f.querySelector('[name=\"' + arguments[0] + '\"]');"
+            "return e ? e.value : '';",
+            field_name,
+        )
+        return (value or "").strip()
+    except Exception:
+        return ""
+
+
+def extract_record_container(driver, wait, player):
+    """현재 페이지에서 포지션에 맞는 전체 기록 섹션 outerHTML을 가져옴. 실패 시 빈 문자열"""
+    # 6. 전체 기록 섹션 내용 가져오기 (포지션에 따라 XPath 변경)
+    if player['position'] == '타자':
+        record_xpath = "//*[@id='Record']/div[2]"
+    else:
+        record_xpath = "//*[@id='Record']/div[1]"
+
+    logger.debug(f"전체 기록 섹션 내용 추출 시도 (XPath: {record_xpath})...")
+    try:
+        # 존재 확인과 outerHTML 읽기를 스크립트 한 번으로 처리 (요소 핸들 왕복 없음)
+        with span(STAGE_EXTRACT):
+            record_html = wait_for(driver, lambda d: read_outer_html(d, record_xpath), "기록 섹션 대기")
+        logger.debug(f"  전체 기록 섹션 추출 성공 (길이: {len(record_html)} 문자).")
+        return record_html
+    except TimeoutException:
+        logger.warning(f"오류: 기록 섹션 컨테이너({record_xpath})가 시간 내에 로드되지 않았습니다.")
+        player['error'] = "기록 섹션 로드 시간 초과"
+    except Exception as e:
+        logger.warning(f"기록 섹션 추출 중 오류: {e}")
+        player['error'] = f"기록 섹션 추출 오류: {e}"
+    return ""
+
+
+def scrape_record_html(driver, wait, player, base_url, page_state=None):
+    """
+    한 선수의 전체 기록 섹션 outerHTML을 가져옵니다.
+    선택/추출에 실패하면 빈 문자열을 반환합니다.
+
+    player에 'club_idx'와 'person_no'가 있으면 (playerindex 적중) 드롭다운을 거치지 않고
+    기록 페이지 URL로 바로 이동합니다. 그 페이지에서 기록을 찾지 못하면 (인덱스가 오래되었거나
+    직접 URL 형식이 맞지 않는 경우) 두 ID를 player['stale_ids']로 옮기고 같은 호출 안에서
+    드롭다운 경로로 다시 시도합니다. 드롭다운으로 선택한 경우에는 폼에서 읽은
+    'club_idx'/'person_no'를 player에 기록해 인덱스 갱신에 쓸 수 있게 합니다.
+    실패한 경우 실패 사유를 player['error']에 남깁니다.
+
+    page_state(브라우저 세션별 dict)를 넘기면 현재 폼에 선택된 학교를 기억해 두고,
+    다음 선수가 같은 학교이면 페이지를 다시 열지 않고 선수 드롭다운만 다시 선택합니다.
+    재사용한 폼에서 실패하면 상태를 버리고 처음부터 (페이지 이동부터) 한 번 다시 시도합니다.
+    """
+    player.pop('error', None)
+    if page_state is None:
+        page_state = {}
+    reused = False
+    try:
+        if player.get('club_idx') and player.get('person_no') and player['position'] in RECORD_TYPE_BY_POSITION:
+            page_state.clear()
+            # 증분 갱신 대상이면 player의 begin_year/end_year(새 시즌)만 요청
+            record_url = build_record_url(base_url, player['club_idx'], player['person_no'], player['position'],
+                                          player.get('begin_year'), player.get('end_year'))
+            logger.debug(f"인덱스 적중, 기록 페이지로 바로 접속: {record_url}")
+            with span(STAGE_PAGE_LOAD):
+                driver.get(record_url)
+            record_html = extract_record_container(driver, wait, player)
+            if record_html:
+                return record_html
+            # 인덱스 ID를 버리고 (update_index_from_players가 인덱스에서 지움) 드롭다운으로 다시 시도
+            logger.warning(f"{player['name']} 선수의 직접 URL에서 기록을 찾지 못해 드롭다운으로 다시 시도합니다.")
+            player['stale_ids'] = (player.pop('club_idx'), player.pop('person_no'))
+            player.pop('error', None)
+
+        # 직전 선수와 같은 학교이고 폼의 club_idx도 그대로면 페이지 이동과 학교 선택을 건너뜀
+        reused = (page_state.get('school') == player['school']
+                  and bool(page_state.get('club_idx'))
+                  and read_form_value(driver, 'club_idx') == page_state['club_idx'])
+        if reused:
+            logger.debug(f"'{player['school']}' 폼 재사용 (페이지 이동/학교 선택 생략)")
+        else:
+            page_state.clear()
+            logger.debug(f"접속 시도: {base_url}")
+            with span(STAGE_PAGE_LOAD):
+                driver.get(base_url)
+                # 페이지의 기본 요소(예: 학교 드롭다운)가 로드될 때까지 기다림
+                wait_for(driver, EC.presence_of_element_located((By.XPATH, school_dropdown_trigger_xpath)), "페이지 로드 대기")
+
+            # --- 상호작용: 수정된 Helper 함수와 XPath 사용 ---
+            # 1. 학교 선택
+            with span(STAGE_SCHOOL_SELECT) as trace:
+                selected = select_dropdown_option(driver, wait, school_dropdown_trigger_xpath, player['school'], options_li_xpath, "학교")
+                trace['ok'] = bool(selected)
+            if not trace['ok']:
+                logger.warning(f"{player['name']} 선수 처리 중단 (학교 선택 실패).")
+                if selected is None:
+                    mark_permanent_failure(player, "학교 목록에 없음")
+                else:
+                    player['error'] = "학교 선택 실패"
+                return ""
+            page_state['school'] = player['school']
+            page_state['club_idx'] = read_form_value(driver, 'club_idx')
+
+        # 2. 선수 선택 (핵심 이름 비교)
+        with span(STAGE_PLAYER_SELECT) as trace:
+            selected = select_dropdown_option(driver, wait, player_dropdown_trigger_xpath, player['name'], options_li_xpath, "선수")
+            trace['ok'] = bool(selected)
+        if not trace['ok']:
+            if reused:
+                logger.warning(f"재사용한 폼에서 '{player['name']}' 선수 선택 실패. 페이지를 다시 열어 재시도합니다.")
+                page_state.clear()
+                return scrape_record_html(driver, wait, player, base_url, page_state)
+            logger.warning(f"{player['name']} 선수 처리 중단 (선수 선택 실패).")
+            if selected is None:
+                mark_permanent_failure(player, "선수 목록에 없음")
+            else:
+                player['error'] = "선수 선택 실패"
+            return ""
+
+        # 선택 결과로 채워진 ID를 기록 (인덱스 갱신용)
+        club_idx = read_form_value(driver, 'club_idx')
+        person_no = read_form_value(driver, 'person_no')
+        if club_idx and person_no:
+            player['club_idx'] = club_idx
+            player['person_no'] = person_no
+
+        # 3. 포지션 검색 버튼 클릭
+        logger.debug("검색 버튼 클릭 시도...")
+        # 검색 클릭 후 #Record가 실제로 다시 그려졌는지 확인하기 위한 기준 내용
+        record_before = record_snapshot(driver)
+        with span(STAGE_SEARCH_CLICK):
+            position_search_button = wait_for(driver, EC.element_to_be_clickable((By.XPATH, position_search_button_xpath)), "검색 버튼")
+            driver.execute_script("arguments[0].scrollIntoViewIfNeeded(true);", position_search_button)
+            driver.execute_script("arguments[0].click();", position_search_button)
+            try:
+                wait_for(driver, record_changed(record_before), "검색 결과 갱신", timeout=10)
+            except TimeoutException:
+                logger.warning("경고: 검색 후 #Record 내용 변경을 감지하지 못했습니다.")
+        logger.debug("검색 버튼 클릭 성공.")
+
+        # 4. 포지션에 따라 해당 항목 클릭
+        # (탭 클릭 후 #Record가 갱신될 때까지를 포함. 기준 내용은 검색 결과가 반영된 뒤에 잡아
+        #  검색 응답만으로 갱신 조건이 충족되지 않도록 함)
+        record_before = record_snapshot(driver)
+        with span(STAGE_POSITION_CLICK) as trace:
+            try:
+                if player['position'] == '타자':
+                    position_xpath = '//*[@id="recordForm"]/div/div[3]/div[2]/ul/li[1]/a'
+                elif player['position'] == '투수':
+                    position_xpath = '//*[@id="recordForm"]/div/div[3]/div[2]/ul/li[2]/a'
+                else:
+                    logger.warning(f"알 수 없는 포지션: {player['position']}. 처리 중단.")
+                    mark_permanent_failure(player, f"알 수 없는 포지션: {player['position']}")
+                    trace['ok'] = False
+                    return ""
+
+                logger.debug(f"포지션 '{player['position']}' 항목 클릭 시도 (XPath: {position_xpath})...")
+                position_element = wait_for(driver, EC.element_to_be_clickable((By.XPATH, position_xpath)), "포지션 탭")
+                driver.execute_script("arguments[0].scrollIntoViewIfNeeded(true);", position_element)
+                driver.execute_script("arguments[0].click();", position_element)
+                logger.debug(f"포지션 '{player['position']}' 항목 클릭 성공.")
+            except TimeoutException:
+                logger.warning(f"오류: 포지션 항목({position_xpath})을 시간 내에 클릭할 수 없습니다.")
+                player['error'] = "포지션 항목 클릭 시간 초과"
+                trace['ok'] = False
+                return ""
+            except Exception as e:
+                logger.warning(f"포지션 항목 클릭 중 오류: {e}")
+                player['error'] = f"포지션 항목 클릭 오류: {e}"
+                trace['ok'] = False
+                return ""
+
+            try:
+                wait_for(driver, record_changed(record_before), "포지션 기록 갱신", timeout=10)
+            except TimeoutException:
+                logger.warning("경고: 포지션 클릭 후 #Record 내용 변경을 감지하지 못했습니다. 현재 내용으로 추출합니다.")
+        logger.debug(driver.current_url) # 현재 URL 출력 (디버깅용)
+
+        return extract_record_container(driver, wait, player)
+
+    except Exception as e:
+        logger.warning(f"스크래핑 중 예기치 않은 오류 발생 ({player['name']}): {e}")
+        player['error'] = f"예기치 않은 오류: {e}"
+        page_state.clear()
+    return ""
+
+
+def schedule_by_school(player_list, max_group_size=None):
+    """
+    같은 학교 선수가 연달아 처리되도록 선수를 학교별 그룹으로 묶습니다.
+    학교는 입력에 처음 나온 순서, 학교 안에서는 포지션별로 모이며 같은 포지션 안의 순서는 유지됩니다.
+    max_group_size를 주면 큰 학교 그룹을 그 크기 이하로 나눕니다 (병렬 워커 간 분배용).
+
+    Returns:
+        list: [[player, ...], ...] 처리 순서대로의 그룹 리스트.
+    """
+    by_school = {}
+    for player in player_list:
+        by_school.setdefault(player['school'], {}).setdefault(player['position'], []).append(player)
+
+    groups = []
+    for by_position in by_school.values():
+        group = [player for players in by_position.values() for player in players]
+        size = max_group_size or len(group)
+        groups.extend(group[i:i + size] for i in range(0, len(group), size))
+    return groups
+
+
+def scrape_player_stats(player_list, base_url, headless=True, on_result=None):
+    """
+    Selenium을 사용하여 선수별 전체 기록 섹션 스크래핑 및 URL 조정
+
+    선수는 schedule_by_school 순서(학교별로 묶음)로 처리하여 같은 학교 선수 사이에서는
+    불러온 폼을 재사용합니다. 반환되는 dict는 입력 순서를 따릅니다.
+
+    on_result(player, html)를 넘기면 선수 한 명이 끝날 때마다 (처리 순서대로) 호출하고 결과를 모아두지 않습니다.
+    (결과 저장소로 바로 흘려보내 메모리를 일정하게 유지할 때 사용)
+    """
+
+    all_player_data = {}
+
+    driver, wait = create_driver(headless)
+    if driver is None:
+        return None
+
+    page_state = {}
+    try:
+        for group in schedule_by_school(player_list):
+            for player in group:
+                logger.info(f"\n--- {player['name']} ({player['school']}, {player['position']}) 선수 전체 기록 스크래핑 시작 ---")
+                with trace_player(player) as trace:
+                    record_html = scrape_record_html(driver, wait, player, base_url, page_state)
+                    trace['ok'] = bool(record_html)
+
+                if not record_html:
+                    # 실패한 다음 선수는 페이지 이동부터 다시 시작
+                    page_state.clear()
+                    record_html = NO_DATA_HTML  # 오류시 HTML 저장
+                    logger.warning(f"{player['name']} 선수의 전체 기록을 찾지 못했거나 추출에 실패했습니다.")
+
+                # HTML 문자열 저장
+                if on_result is not None:
+                    on_result(player, record_html)
+                else:
+                    all_player_data[player_key(player)] = record_html
+        logger.info("\n모든 선수 스크래핑 완료. 브라우저 종료 중...")
+    finally:
+        # on_result(결과 저장소 등)에서 예외가 나도 headless 브라우저가 남지 않도록 항상 종료
+        driver.quit()
+    if on_result is not None:
+        return all_player_data
+    # 입력 순서대로 정렬
+    return {player_key(player): all_player_data[player_key(player)] for player in player_list}
+
+
+# --- 2-1. 여러 headless 브라우저 세션으로 병렬 스크래핑 ---
+def _scrape_worker(worker_id, work_queue, base_url, emit, headless):
+    """
+    작업 큐에서 학교별 선수 그룹을 하나씩 꺼내 처리하는 워커.
+    그룹 안에서는 불러온 폼을 재사용하고, 실패한 다음 선수부터는 페이지를 다시 엽니다.
+    세션이 죽으면 재시작하고, 진행 중이던 선수는 한 번 다시 큐에 넣습니다.
+    재시작도 실패하면 워커만 종료되고 남은 선수는 다른 워커가 처리합니다.
+    """
+    # 동시에 뜬 세션끼리 디스크 캐시 디렉토리를 공유하지 않도록 워커별로 나눔
+    cache_dir = os.path.join(DEFAULT_BROWSER_CACHE_DIR, f"worker{worker_id}")
+    driver, wait = create_driver(headless, cache_dir)
+    if driver is None:
+        logger.warning(f"[워커 {worker_id}] 브라우저 시작 실패. 워커 종료.")
+        return
+
+    try:
+        while True:
+            try:
+                group, attempt = work_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            page_state = {}
+            for i, player in enumerate(group):
+                logger.info(f"\n[워커 {worker_id}] --- {player['name']} ({player['school']}, {player['position']}) 스크래핑 시작 ---")
+                with trace_player(player) as trace:
+                    record_html = scrape_record_html(driver, wait, player, base_url, page_state)
+                    trace['ok'] = bool(record_html)
+                if record_html:
+                    emit(player, record_html)
+                    continue
+
+                page_state.clear()
+                if is_driver_alive(driver):
+                    logger.warning(f"[워커 {worker_id}] {player['name']} 선수의 전체 기록을 찾지 못했거나 추출에 실패했습니다.")
+                    emit(player, NO_DATA_HTML)
+                    continue
+
+                # 세션 크래시: 브라우저를 재시작하고 해당 선수는 한 번만 재시도
+                logger.warning(f"[워커 {worker_id}] 브라우저 세션이 응답하지 않습니다. 재시작 중...")
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                if attempt == 0:
+                    work_queue.put(([player], attempt + 1))
+                else:
+                    player['error'] = "브라우저 세션 크래시"
+                    emit(player, NO_DATA_HTML)
+                driver, wait = create_driver(headless, cache_dir)
+                if driver is None:
+                    logger.warning(f"[워커 {worker_id}] 브라우저 재시작 실패. 워커 종료.")
+                    # 그룹의 남은 선수는 다른 워커가 처리하도록 되돌려 놓음
+                    if group[i + 1:]:
+                        work_queue.put((group[i + 1:], attempt))
+                    return
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+def scrape_player_stats_parallel(player_list, base_url, num_workers=None, headless=True, on_result=None):
+    """
+    선수 리스트를 학교별 그룹으로 묶어 N개의 headless 브라우저 세션에 나눠 병렬로 스크래핑합니다.
+    결과는 scrape_player_stats와 같은 {'이름_학교': html} 형태이며 입력 순서를 따릅니다.
+
+    Args:
+        player_list (list): parse_player_input 결과.
+        base_url (str): 기록 페이지 URL.
+        num_workers (int): 브라우저 세션 수 (기본값: CPU 코어 수).
+        headless (bool): headless 모드 사용 여부.
+        on_result (callable): 선수별 완료 콜백 (player, html). 주어지면 결과를 모아두지 않으며,
+            여러 워커에서 호출되더라도 한 번에 하나씩만 호출됩니다.
+    """
+    if not player_list:
+        return {}
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, len(player_list)))
+
+    # 학교별 그룹 단위로 나눠 주되, 큰 학교는 워커 수에 맞게 쪼개 한 워커에 몰리지 않게 함
+    work_queue = queue.Queue()
+    for group in schedule_by_school(player_list, max_group_size=-(-len(player_list) // num_workers)):
+        work_queue.put((group, 0))
+
+    results = {}
+    reported = set()
+    emit_lock = threading.Lock()
+
+    def emit(player, record_html):
+        with emit_lock:
+            reported.add(player_key(player))
+            if on_result is not None:
+                on_result(player, record_html)
+            else:
+                results[player_key(player)] = record_html
+
+    logger.info(f"브라우저 세션 {num_workers}개로 {len(player_list)}명 병렬 스크래핑 시작...")
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(_scrape_worker, i + 1, work_queue, base_url, emit, headless)
+            for i in range(num_workers)
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"워커 실행 중 예기치 않은 오류 발생: {e}")
+
+    # 처리되지 못한 선수(모든 워커 종료 등)는 실패 HTML로 채움
+    for player in player_list:
+        if player_key(player) not in reported:
+            emit(player, NO_DATA_HTML)
+
+    logger.info("\n모든 선수 병렬 스크래핑 완료.")
+    if on_result is not None:
+        return {}
+    # 입력 순서대로 병합
+    return {player_key(player): results[player_key(player)] for player in player_list}
+
+# --- 4. 전체 실행 흐름 (인덱스 -> 캐시 -> 수집/재시도 -> 결과 저장소 -> Excel) ---
+
+# KBO 기본 URL (필터링 전)
+DEFAULT_BASE_URL = "https://www.korea-baseball.com/record/record/player_record?kind_cd=31&lig_idx=&group_no=&part_no=&record_type=1&begin_year=2020&end_year=2025&club_idx=&person_no=&group_part_idx="
+
+
+def run_pipeline(player_list, base_url=DEFAULT_BASE_URL, num_workers=0, cache_only=False, resume=False,
+                 headless=True, fetch_func=None, store_path=None, excel_path="kbo_player_stats_final.xlsx",
+                 incremental=False, excel_layout='sheets', cache_dir=DEFAULT_CACHE_DIR, cache_ttl=DEFAULT_TTL,
+                 cache_max_bytes=DEFAULT_MAX_BYTES, index_path=None):
+    """
+    선수 리스트의 기록을 수집하여 결과 저장소(SQLite)에 쌓고 Excel로 내보냅니다.
+
+    Args:
+        player_list (list): parse_player_input 결과.
+        base_url (str): 기록 페이지 URL.
+        num_workers (int): 병렬 브라우저 세션 수 (0이면 브라우저 하나로 순차 처리, None이면 CPU 코어 수).
+        cache_only (bool): True면 브라우저 없이 캐시된 기록만 사용.
+        resume (bool): True면 이전 실행에서 완료된 선수는 건너뛰고 남은 선수만 처리.
+        headless (bool): headless 모드 사용 여부.
+        fetch_func (callable): 수집 함수를 직접 지정 (예: recordfetch.fetch_player_stats). 없으면 Selenium.
+        store_path (str): 결과 저장소 경로 (기본값: recordstore.DEFAULT_STORE_PATH).
+        excel_path (str): 저장할 Excel 파일 경로 (None이면 Excel을 만들지 않음).
+        incremental (bool): True면 저장소에 있는 선수는 닫히지 않은 새 시즌만 받아 기존 기록에 합침.
+        excel_layout (str): 'sheets'(선수별 시트), 'long'(선수/학교/포지션/시즌 롱 포맷 시트 하나), 'both'.
+        cache_dir (str): 기록 HTML 디스크 캐시 디렉터리.
+        cache_ttl (int): 캐시 유효 기간(초). None이면 만료 없음 (기록이 바뀌지 않는 은퇴 선수 등).
+        cache_max_bytes (int): 캐시 최대 크기 (바이트). 초과 시 오래 사용하지 않은 항목부터 삭제.
+        index_path (str): 학교/선수 ID 인덱스 파일 경로 (기본값: playerindex.DEFAULT_INDEX_PATH).
+
+    Returns:
+        list: 최종적으로 실패한 선수 리스트.
+    """
+    # 학교/선수 ID 인덱스: 적중한 선수는 드롭다운 없이 기록 URL로 바로 이동
+    from .playerindex import (
+        DEFAULT_INDEX_PATH, load_player_index, save_player_index, attach_player_ids, update_index_from_players,
+    )
+    from .recordcache import scrape_with_cache, year_range_from_url
+    from .recordstore import DEFAULT_STORE_PATH, open_record_store, plan_incremental_refresh, store_sink, iter_player_records
+    from .jobjournal import init_job_journal, run_jobs
+
+    if not player_list:
+        logger.warning("처리할 선수 정보가 없습니다.")
+        return []
+
+    # 실행이 끝난 뒤 이번 실행(재시도 포함)의 소요 시간만 한 번 보고하도록 기록을 비움
+    reset_traces()
+
+    index_path = index_path or DEFAULT_INDEX_PATH
+    player_index = load_player_index(index_path)
+    attach_player_ids(player_list, player_index)
+    if fetch_func is None:
+        if num_workers == 0:
+            fetch_func = partial(scrape_player_stats, headless=headless)
+        else:
+            fetch_func = partial(scrape_player_stats_parallel, num_workers=num_workers, headless=headless)
+    # 디스크 캐시: 유효한 기록이 있는 선수는 브라우저 없이 재사용
+    # 결과 저장소: 선수 한 명이 끝날 때마다 파싱하여 SQLite에 바로 저장
+    record_store = open_record_store(store_path or DEFAULT_STORE_PATH)
+    begin_year, end_year = year_range_from_url(base_url)
+    fetch_list = player_list
+    if incremental:
+        # 증분 갱신: 마감된 시즌만 남은 선수는 건너뛰고, 나머지는 새 시즌만 요청
+        fetch_list = plan_incremental_refresh(record_store, player_list, begin_year, end_year)
+        logger.info(f"증분 갱신: 전체 {len(player_list)}명 중 {len(fetch_list)}명 수집 "
+              f"(새 시즌만 {sum(1 for player in fetch_list if player.get('incremental'))}명)")
+    # 작업 기록: 실패한 선수는 사유와 함께 남기고 새 세션으로 재시도
+    init_job_journal(record_store)
+    failed = run_jobs(record_store, fetch_list, base_url,
+                      partial(scrape_with_cache, fetch_func=fetch_func, cache_dir=cache_dir, ttl=cache_ttl,
+                              max_bytes=cache_max_bytes, cache_only=cache_only),
+                      on_result=store_sink(record_store, begin_year, end_year), resume=resume)
+    if update_index_from_players(player_index, player_list):
+        save_player_index(player_index, index_path)
+
+    print_trace_summary()
+    if excel_path is not None:
+        # 저장소에서 선수 한 명씩 읽어 바로 Excel로 흘려보냄 (전체 기록을 메모리에 모으지 않음)
+        from .recordexport import export_store
+        if next(iter_player_records(record_store, player_list), None) is None:
+            logger.warning("스크래핑된 데이터가 없어 Excel 파일을 생성하지 않습니다.")
+        else:
+            try:
+                written = export_store(record_store, excel_path, player_list, excel_layout)
+                logger.info(f"\n{written}명의 기록을 성공적으로 '{excel_path}' 파일에 저장했습니다.")
+            except Exception as e:
+                logger.error(f"Excel 파일 저장 중 오류 발생: {e}")
+    record_store.close()
+    return failed
+
+
+# --- 실행 부분 (명령행 도구는 cli.py 참고) ---
+if __name__ == "__main__":
+    input_player_data = """
+    김진욱 (강릉고, 투수)
+    김기중 (유신고, 투수)
+    이재희 (대전고, 투수)
+    나승엽 (덕수고, 내야수)
+    김휘집 (신일고, 내야수)
+    """ # 테스트 데이터 (이름, 학교, 포지션)
+
+    # 로그 수준 ("DEBUG"면 드롭다운 옵션 목록까지 출력) 및 단계별 소요 시간 JSON-lines 파일
+    configure_tracing("INFO", "kbo_scrape_trace.jsonl")
+    run_pipeline(parse_player_input(input_player_data), DEFAULT_BASE_URL)
+    close_tracing()
\ No newline at end of file
@@ -0,0 +1,170 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from .waitengine import print_latency_report, record_latency, reset_latencies
+
+# 스크래핑 진행 로그 (기본 INFO, configure_tracing으로 변경)
+logger = logging.getLogger("kbhughscrap")
+
+# 선수 한 명을 처리하는 데 걸린 전체 시간의 단계 이름 (waitengine 지연 시간 통계와 공유)
+PLAYER_STAGE = "선수 전체"
+
+# 브라우저 세션 시작 단계 이름
+STAGE_BROWSER_START = "브라우저 시작"
+
+# 선수별 처리 단계 이름
+STAGE_PAGE_LOAD = "페이지 로드"
+STAGE_SCHOOL_SELECT = "학교 선택"
+STAGE_PLAYER_SELECT = "선수 선택"
+STAGE_SEARCH_CLICK = "검색 클릭"
+STAGE_POSITION_CLICK = "포지션 클릭"
+STAGE_EXTRACT = "기록 추출"
+STAGE_PARSE = "파싱"
+STAGE_WRITE = "저장"
+
+# 선수별 소요 시간 [(초, 이름, 학교, 포지션, 성공 여부), ...]
+# (단계별 소요 시간은 waitengine의 지연 시간 기록 하나에 대기 단계와 함께 모음)
+_player_times = []
+_lock = threading.Lock()
+_trace_file = None
+# 현재 스레드가 처리 중인 선수 (span에 선수 정보를 자동으로 붙이기 위함)
+_current = threading.local()
+
+
+class _PrintHandler(logging.Handler):
+    """기존 print 출력과 같은 곳(sys.stdout)으로 로그를 내보내는 핸들러"""
+
+    def emit(self, record):
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+logger.addHandler(_PrintHandler())
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+# --- 1. 설정 ---
+def configure_tracing(level="INFO", trace_path=None):
+    """
+    로그 수준과 JSON-lines 타이밍 파일을 설정합니다.
+
+    Args:
+        level (str|int): 로그 수준 ("DEBUG"면 드롭다운 옵션 목록 등 상세 출력 포함).
+        trace_path (str): 단계/선수별 소요 시간을 한 줄에 하나씩 기록할 파일 경로 (None이면 기록 안 함).
+    """
+    global _trace_file
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    close_tracing()
+    if trace_path:
+        with _lock:
+            _trace_file = open(trace_path, 'a', encoding='utf-8')
+
+
+def close_tracing():
+    """타이밍 파일을 닫음"""
+    global _trace_file
+    with _lock:
+        if _trace_file is not None:
+            _trace_file.close()
+            _trace_file = None
+
+
+def _write_event(event):
+    with _lock:
+        if _trace_file is not None:
+            _trace_file.write(json.dumps(event, ensure_ascii=False) + "\n")
+            _trace_file.flush()
+
+
+# --- 2. span 기록 ---
+def _player_fields(player):
+    if player is None:
+        return {}
+    return {'player': player.get('name'), 'school': player.get('school'), 'position': player.get('position')}
+
+
+@contextmanager
+def span(stage, player=None):
+    """
+    with 블록 하나를 stage 단계로 기록합니다. player를 생략하면 trace_player로 지정된 현재 선수를 씁니다.
+    블록 안에서 yield된 dict의 'ok'를 False로 바꾸면 실패로 기록되고, 예외가 나도 실패로 기록됩니다.
+    """
+    player = player if player is not None else getattr(_current, 'player', None)
+    info = {'ok': True}
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        yield info
+    except Exception:
+        info['ok'] = False
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        record_latency(stage, seconds, failed=not info['ok'])
+        logger.debug(f"  [{stage}] {seconds:.3f}s{'' if info['ok'] else ' (실패)'}")
+        _write_event({'ts': started, 'kind': 'stage', 'stage': stage, 'seconds': round(seconds, 6),
+                      'ok': info['ok'], **_player_fields(player)})
+
+
+def record_player_time(player, seconds, ok, started=None):
+    """선수 한 명의 전체 처리 시간을 기록 (지연 시간 통계, 요약, 타이밍 파일)"""
+    record_latency(PLAYER_STAGE, seconds, failed=not ok)
+    with _lock:
+        _player_times.append((seconds, player['name'], player['school'], player['position'], ok))
+    event = {'ts': started if started is not None else time.time() - seconds, 'kind': 'player',
+             'stage': PLAYER_STAGE, 'seconds': round(seconds, 6), 'ok': ok, **_player_fields(player)}
+    if not ok and player.get('error'):
+        event['error'] = player['error']
+    _write_event(event)
+
+
+@contextmanager
+def trace_player(player):
+    """
+    선수 한 명의 처리 구간. 안에서 열리는 span에는 이 선수 정보가 붙습니다.
+    yield된 dict의 'ok'에 성공 여부를 넣습니다 (예외가 나면 실패).
+    """
+    previous = getattr(_current, 'player', None)
+    _current.player = player
+    info = {'ok': True}
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        yield info
+    except Exception:
+        info['ok'] = False
+        raise
+    finally:
+        _current.player = previous
+        record_player_time(player, time.perf_counter() - start, info['ok'], started)
+
+
+# --- 3. 요약 ---
+def print_trace_summary(top=5):
+    """
+    실행이 끝난 뒤 한 번 출력하는 소요 시간 보고서 (로그 수준 INFO).
+    단계/대기별 지연 시간 통계(waitengine)와 가장 오래 걸린 선수를 함께 출력합니다.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    print_latency_report()
+    with _lock:
+        player_times = list(_player_times)
+    if player_times:
+        logger.info(f"\n=== 가장 오래 걸린 선수 {min(top, len(player_times))}명 ===")
+        for seconds, name, school, position, ok in sorted(player_times, reverse=True)[:top]:
+            logger.info(f"{seconds:>8.2f}s  {name} ({school}, {position}){'' if ok else ' - 실패'}")
+        logger.info("=" * 27)
+
+
+def reset_traces():
+    """기록된 단계/선수별 소요 시간을 모두 지움"""
+    reset_latencies()
+    with _lock:
+        _player_times.clear()
@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from .domquery import ACTIVE_OPTIONS_XPATH, core_text, read_options
+
+# tracing.logger와 같은 로거 (tracing이 이 모듈을 불러오므로 이름으로 가져옴)
+logger = logging.getLogger("kbhughscrap")
+
+# 조건 확인 주기 (WebDriverWait 기본값 0.5초는 준비된 페이지에서도 대기 시간을 만듦)
+POLL_FREQUENCY = 0.05
+
+# 지연 시간 히스토그램 구간 경계 (초)
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10]
+
+# 단계별 지연 시간 기록: {단계명: [초, ...]}, {단계명: 실패 횟수}
+# (wait_for 대기 단계와 tracing.span 처리 단계가 함께 쌓이는 유일한 소요 시간 기록)
+_latencies = defaultdict(list)
+_failures = defaultdict(int)
+_lock = threading.Lock()
+
+
+# --- 1. DOM 조건 (expected_conditions 형식: driver를 받아 참/거짓 반환) ---
+def dropdown_open(driver):
+    """'abs_select on' 클래스를 가진 드롭다운이 열려 있으면 True"""
+    return bool(driver.execute_script("return !!document.querySelector('div.abs_select.on');"))
+
+
+def options_populated(placeholder=None, options_xpath=ACTIVE_OPTIONS_XPATH):
+    """
+    열린 드롭다운에 실제 옵션(<li>)이 채워지면 [(전체 텍스트, 값), ...] 리스트를 반환하는 조건.
+    placeholder("학교명", "선수명" 등)만 있는 상태는 아직 로딩 중으로 봅니다.
+    옵션 전체를 스크립트 한 번으로 읽으므로, 반환값을 그대로 매칭에 쓰면 추가 왕복이 없습니다.
+    """
+    def condition(driver):
+        options = read_options(driver, options_xpath)
+        if any(text and core_text(text) != placeholder for text, _ in options):
+            return options
+        return False
+    return condition
+
+
+def _record_html(driver):
+    """#Record의 현재 innerHTML (없으면 빈 문자열)"""
+    return driver.execute_script(
+        "var r = document.getElementById('Record'); return r ? r.innerHTML : '';"
+    ) or ""
+
+
+def record_snapshot(driver):
+    """
+    #Record의 현재 자식 요소에 표시(data-kbh-seen)를 남기고 표시된 innerHTML을 반환합니다.
+    다시 그려진 요소에는 표시가 없으므로, 같은 내용으로 다시 그려져도 record_changed가 감지합니다.
+    """
+    return driver.execute_script(
+        "var r = document.getElementById('Record'); if (!r) return '';"
+        "for (var i = 0; i < r.children.length; i++) r.children[i].setAttribute('data-kbh-seen', '1');"
+        "return r.innerHTML;"
+    ) or ""
+
+
+def record_changed(previous_html):
+    """#Record가 record_snapshot(previous_html) 이후 다시 그려지면 True인 조건"""
+    from selenium.common.exceptions import StaleElementReferenceException
+
+    def condition(driver):
+        try:
+            current = _record_html(driver)
+        except StaleElementReferenceException:
+            return False
+        return bool(current) and current != previous_html
+    return condition
+
+
+# --- 2. 대기 및 지연 시간 기록 ---
+def record_latency(step, seconds, failed=False):
+    """단계별 소요 시간을 기록 (여러 워커 스레드에서 호출 가능)"""
+    with _lock:
+        _latencies[step].append(seconds)
+        if failed:
+            _failures[step] += 1
+
+
+def wait_for(driver, condition, step, timeout=15, retries=0, backoff=0.5):
+    """
+    condition이 참이 될 때까지만 기다립니다 (고정 sleep 없음).
+    retries를 주면 시간 초과 시 backoff * 2^n 초 쉬고 다시 기다리며, 모두 실패하면 TimeoutException.
+    (없는 요소를 기다리는 실패는 재시도해도 같은 시간만 더 쓰므로, 늦게 채워지는 목록 등에서만 사용)
+    소요 시간은 step 이름으로 기록됩니다.
+    """
+    # selenium은 실제로 기다릴 때만 불러옴 (지연 시간 기록만 쓰는 export 등의 시작 시간 단축)
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    start = time.perf_counter()
+    for attempt in range(retries + 1):
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(condition)
+            record_latency(step, time.perf_counter() - start)
+            return result
+        except TimeoutException:
+            if attempt == retries:
+                record_latency(step, time.perf_counter() - start, failed=True)
+                raise
+            delay = backoff * (2 ** attempt)
+            logger.info(f"  [{step}] 조건 대기 시간 초과, {delay:.1f}초 후 재시도 ({attempt + 1}/{retries})...")
+            time.sleep(delay)
+
+
+# --- 3. 통계 ---
+def _percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def latency_report():
+    """
+    단계별 지연 시간 통계를 반환합니다.
+    {단계명: {'count', 'failures', 'total', 'p50', 'p95', 'max', 'histogram'}}
+    histogram은 LATENCY_BUCKETS 경계별 개수 리스트 (마지막 칸은 최대 경계 초과).
+    """
+    with _lock:
+        snapshot = {step: list(values) for step, values in _latencies.items()}
+        failures = dict(_failures)
+
+    report = {}
+    for step, values in snapshot.items():
+        values.sort()
+        histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        for value in values:
+            bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if value <= bound), len(LATENCY_BUCKETS))
+            histogram[bucket] += 1
+        report[step] = {
+            'count': len(values),
+            'failures': failures.get(step, 0),
+            'total': sum(values),
+            'p50': _percentile(values, 50),
+            'p95': _percentile(values, 95),
+            'max': values[-1],
+            'histogram': histogram,
+        }
+    return report
+
+
+def print_latency_report():
+    """단계별 지연 시간 통계를 총 소요 시간이 큰 순서로 출력 (로그 수준 INFO, tracing.print_trace_summary에서 호출)"""
+    report = latency_report()
+    if not report or not logger.isEnabledFor(logging.INFO):
+        return
+    labels = [f"≤{bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+    logger.info("\n=== 단계별 소요 시간 ===")
+    for step, stats in sorted(report.items(), key=lambda item: item[1]['total'], reverse=True):
+        logger.info(
+            f"{step:<16} n={stats['count']:<4} 실패={stats['failures']:<3} "
+            f"합계={stats['total']:.2f}s p50={stats['p50']:.3f}s p95={stats['p95']:.3f}s max={stats['max']:.3f}s"
+        )
+        buckets = ", ".join(f"{label}:{n}" for label, n in zip(labels, stats['histogram']) if n)
+        logger.info(f"{'':<16} [{buckets}]")
+    logger.info("=" * 23)
+
+
+def reset_latencies():
+    """기록된 지연 시간을 모두 지움"""
+    with _lock:
+        _latencies.clear()
+        _failures.clear()
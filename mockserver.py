@@ -0,0 +1,282 @@
+import html
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+# 모의 기록 페이지 경로 (실제 사이트와 같은 경로/쿼리 형식)
+RECORD_PATH = "/record/record/player_record"
+
+# 모의 데이터 헤더 (투수/타자)
+PITCHER_HEADERS = ['연도', '팀명', '경기', '승', '패', '세', '이닝', '피안타', '볼넷', '삼진', '실점', '자책점', '평균자책점']
+BATTER_HEADERS = ['연도', '팀명', '경기', '타수', '안타', '2루타', '3루타', '홈런', '타점', '득점', '도루', '볼넷', '삼진', '타율', '출루율', '장타율', 'OPS']
+
+# 모의 데이터의 학교당 선수 수 (같은 학교 선수가 여러 명 나오도록)
+PLAYERS_PER_SCHOOL = 8
+
+# 드롭다운/검색/포지션 탭 동작을 흉내 내는 스크립트
+PAGE_SCRIPT = """
+(function () {
+  var form = document.getElementById('recordForm');
+  function input(name) { return form.querySelector('[name="' + name + '"]'); }
+  function bindOptions(select, onPick) {
+    select.querySelectorAll('li').forEach(function (li) {
+      li.addEventListener('click', function (e) {
+        e.stopPropagation();
+        select.querySelector('span').textContent = li.textContent;
+        select.classList.remove('on');
+        onPick(li.getAttribute('data-value'));
+      });
+    });
+  }
+  var school = document.getElementById('schoolSelect');
+  var player = document.getElementById('playerSelect');
+  [school, player].forEach(function (select) {
+    select.addEventListener('click', function () { select.classList.toggle('on'); });
+  });
+  function loadPlayers(clubIdx) {
+    var ul = player.querySelector('ul');
+    ul.innerHTML = '<li data-value="">선수명</li>';
+    input('person_no').value = '';
+    var xhr = new XMLHttpRequest();
+    xhr.open('GET', '/api/players?club_idx=' + encodeURIComponent(clubIdx));
+    xhr.onload = function () {
+      ul.innerHTML = xhr.responseText;
+      bindOptions(player, function (value) { input('person_no').value = value; });
+    };
+    xhr.send();
+  }
+  bindOptions(school, function (value) { input('club_idx').value = value; loadPlayers(value); });
+  function loadRecord() {
+    var params = ['club_idx', 'person_no', 'record_type', 'begin_year', 'end_year'].map(function (name) {
+      return name + '=' + encodeURIComponent(input(name).value);
+    }).join('&');
+    var xhr = new XMLHttpRequest();
+    xhr.open('GET', '/api/record?' + params);
+    xhr.onload = function () { document.getElementById('Record').innerHTML = xhr.responseText; };
+    xhr.send();
+  }
+  document.getElementById('searchButton').addEventListener('click', function (e) { e.preventDefault(); loadRecord(); });
+  document.querySelectorAll('.record_tab a').forEach(function (a) {
+    a.addEventListener('click', function (e) {
+      e.preventDefault();
+      input('record_type').value = a.getAttribute('data-type');
+      loadRecord();
+    });
+  });
+})();
+"""
+
+PAGE_STYLE = """
+.abs_select ul { display: none; }
+.abs_select.on ul { display: block; }
+"""
+
+
+# --- 1. 모의 데이터 ---
+def mock_players(num_players):
+    """
+    모의 선수 리스트를 만듭니다. (parse_player_input 결과와 같은 형태 + club_idx/person_no)
+    홀수 번째는 투수, 짝수 번째는 타자이며 PLAYERS_PER_SCHOOL명씩 같은 학교입니다.
+    """
+    players = []
+    for i in range(num_players):
+        school_no = i // PLAYERS_PER_SCHOOL
+        players.append({
+            'name': f"선수{i:04d}",
+            'school': f"모의{school_no:03d}고",
+            'position': '투수' if i % 2 == 0 else '타자',
+            'club_idx': str(1000 + school_no),
+            'person_no': str(100000 + i),
+        })
+    return players
+
+
+def mock_input_text(num_players):
+    """parse_player_input 입력 형식('이름 (학교, 포지션)')의 모의 텍스트"""
+    positions = {'투수': '투수', '타자': '내야수'}
+    return "\n".join(
+        f"{player['name']} ({player['school']}, {positions[player['position']]})"
+        for player in mock_players(num_players)
+    )
+
+
+def mock_draft_text(num_players):
+    """format_player_data 입력 형식(라운드 구분자, 학교-대학 이력 포함)의 모의 텍스트"""
+    lines = []
+    for i, player in enumerate(mock_players(num_players)):
+        if i and i % 10 == 0:
+            lines.append(f"{i // 10 + 1} →")
+        position = '투수' if player['position'] == '투수' else ('내야수', '외야수', '포수')[i % 3]
+        history = f"모의중{i % 7}고-{player['school']}" if i % 4 == 0 else player['school']
+        lines.append(f"{player['name']} ({history} {position})")
+    return "\n".join(lines)
+
+
+def _record_rows(person_no, position, begin_year, end_year):
+    """선수 번호로 고정된 난수를 써서 시즌별 모의 기록 행을 만듦"""
+    rng = random.Random(f"{person_no}:{position}")
+    rows = []
+    for year in range(begin_year, end_year + 1):
+        games = rng.randint(5, 30)
+        if position == '투수':
+            innings = round(rng.randint(10, 90) + rng.choice([0, 0.1, 0.2]), 1)
+            earned = rng.randint(0, int(innings))
+            rows.append([year, '모의고', games, rng.randint(0, 10), rng.randint(0, 8), rng.randint(0, 5),
+                         innings, rng.randint(5, 80), rng.randint(2, 40), rng.randint(5, 100),
+                         earned + rng.randint(0, 5), earned, f"{earned * 9 / innings:.2f}"])
+        else:
+            at_bats = rng.randint(20, 120)
+            hits = rng.randint(0, at_bats // 2)
+            doubles = rng.randint(0, hits // 3)
+            triples = rng.randint(0, (hits - doubles) // 5)
+            homers = rng.randint(0, (hits - doubles - triples) // 3)
+            walks = rng.randint(0, 30)
+            obp = (hits + walks) / (at_bats + walks)
+            slg = (hits + doubles + 2 * triples + 3 * homers) / at_bats
+            rows.append([year, '모의고', games, at_bats, hits, doubles, triples, homers, rng.randint(0, 40),
+                         rng.randint(0, 40), rng.randint(0, 20), walks, rng.randint(0, 40),
+                         f"{hits / at_bats:.3f}", f"{obp:.3f}", f"{slg:.3f}", f"{obp + slg:.3f}"])
+    return rows
+
+
+def _profile_view(headers, rows):
+    items = ["<li>" + "".join(f"<span>{html.escape(str(h))}</span>" for h in headers) + "</li>"]
+    for row in rows:
+        items.append("<li>" + "".join(f"<span>{html.escape(str(v))}</span>" for v in row) + "</li>")
+    return f'<div class="profile_view"><ul>{"".join(items)}</ul></div>'
+
+
+def render_record_section(person_no, position, begin_year, end_year):
+    """포지션 하나의 기록 섹션 div (scrape_record_html이 추출하는 outerHTML과 같은 형태)"""
+    if position == '투수':
+        return f'<div class="record_pitcher">{_profile_view(PITCHER_HEADERS, _record_rows(person_no, position, begin_year, end_year))}</div>'
+    return f'<div class="record_batter">{_profile_view(BATTER_HEADERS, _record_rows(person_no, position, begin_year, end_year))}</div>'
+
+
+def render_record_sections(person_no, begin_year, end_year):
+    """#Record 내부 HTML: div[1]은 투수 기록, div[2]는 타자 기록"""
+    if not person_no:
+        return ""
+    return (render_record_section(person_no, '투수', begin_year, end_year)
+            + render_record_section(person_no, '타자', begin_year, end_year))
+
+
+# --- 2. 모의 서버 ---
+class MockRecordHandler(BaseHTTPRequestHandler):
+    """recordForm 페이지, 선수 목록 API, 기록 API를 제공하는 요청 처리기"""
+
+    # 서버 생성 시 start_mock_server에서 설정
+    players = []
+    delay = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, status=200):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.delay:
+            time.sleep(self.delay)
+        parts = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query, keep_blank_values=True).items()}
+        begin_year = int(query.get('begin_year') or 2020)
+        end_year = int(query.get('end_year') or 2025)
+
+        if parts.path == RECORD_PATH:
+            self._send(self.render_page(query, begin_year, end_year))
+        elif parts.path == '/api/players':
+            self._send(self.render_player_options(query.get('club_idx', '')))
+        elif parts.path == '/api/record':
+            self._send(render_record_sections(query.get('person_no', ''), begin_year, end_year))
+        else:
+            self._send("<h1>Not Found</h1>", status=404)
+
+    def render_player_options(self, club_idx):
+        options = ['<li data-value="">선수명</li>']
+        for player in self.players:
+            if player['club_idx'] == club_idx:
+                options.append(f'<li data-value="{player["person_no"]}">{html.escape(player["name"])}(투/우)</li>')
+        return "".join(options)
+
+    def render_page(self, query, begin_year, end_year):
+        schools = {}
+        for player in self.players:
+            schools.setdefault(player['club_idx'], player['school'])
+        school_options = '<li data-value="">학교명</li>' + "".join(
+            f'<li data-value="{club_idx}">{html.escape(school)}(모의)</li>' for club_idx, school in schools.items()
+        )
+        hidden = "".join(
+            f'<input type="hidden" name="{name}" value="{html.escape(query.get(name, ""))}">'
+            for name in ('kind_cd', 'club_idx', 'person_no', 'record_type', 'begin_year', 'end_year')
+        )
+        # 직접 URL(club_idx/person_no 포함)로 접속하면 기록을 미리 채워서 보냄
+        record = render_record_sections(query.get('person_no', ''), begin_year, end_year)
+        return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>모의 기록실</title><style>{PAGE_STYLE}</style></head>
+<body>
+<form id="recordForm" action="{RECORD_PATH}" method="get">{hidden}
+  <div>
+    <div>리그</div>
+    <div>기간</div>
+    <div>
+      <div>
+        <div>구분</div>
+        <div>연도</div>
+        <div class="abs_select" id="schoolSelect"><span>학교명</span><ul>{school_options}</ul></div>
+        <div class="abs_select" id="playerSelect"><span>선수명</span><ul><li data-value="">선수명</li></ul></div>
+        <div>기록</div>
+        <div class="btn_search"><a href="#" id="searchButton">검색</a></div>
+      </div>
+      <div class="record_tab"><ul>
+        <li><a href="#" data-type="1">타자</a></li>
+        <li><a href="#" data-type="2">투수</a></li>
+      </ul></div>
+    </div>
+  </div>
+</form>
+<div id="Record">{record}</div>
+<script>{PAGE_SCRIPT}</script>
+</body></html>"""
+
+
+def start_mock_server(num_players=100, delay=0.0, port=0):
+    """
+    모의 기록 사이트를 백그라운드 스레드로 띄웁니다.
+
+    Args:
+        num_players (int): 모의 선수 수 (mock_players와 같은 데이터).
+        delay (float): 요청마다 추가할 지연 시간(초).
+        port (int): 포트 (0이면 빈 포트 자동 선택).
+
+    Returns:
+        tuple: (server, base_url). 끝나면 server.shutdown() 호출.
+    """
+    handler = type('Handler', (MockRecordHandler,), {'players': mock_players(num_players), 'delay': delay})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = (
+        f"http://127.0.0.1:{server.server_port}{RECORD_PATH}"
+        "?kind_cd=31&lig_idx=&group_no=&part_no=&record_type=1&begin_year=2020&end_year=2025"
+        "&club_idx=&person_no=&group_part_idx="
+    )
+    return server, base_url
+
+
+if __name__ == "__main__":
+    mock_server, mock_base_url = start_mock_server()
+    print(f"모의 기록 사이트 실행 중: {mock_base_url}")
+    print(json.dumps(mock_players(3), ensure_ascii=False, indent=1))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        mock_server.shutdown()
@@ -0,0 +1,25 @@
+import sqlite3
+
+from kbhughscrap.jobjournal import init_job_journal, run_jobs
+from kbhughscrap.recordparse import NO_DATA_HTML, mark_permanent_failure
+
+
+def _players():
+    return [{'name': name, 'school': '모의고', 'position': '투수'} for name in ('가', '나')]
+
+
+def test_permanent_failures_are_not_retried():
+    conn = sqlite3.connect(':memory:')
+    init_job_journal(conn)
+    calls = []
+
+    def fetch(player_list, base_url, on_result):
+        calls.append([player['name'] for player in player_list])
+        for player in player_list:
+            if player['name'] == '가':
+                mark_permanent_failure(player, "학교 목록에 없음")
+            on_result(player, NO_DATA_HTML)
+
+    failed = run_jobs(conn, _players(), 'http://x', fetch, backoff=0)
+    assert calls == [['가', '나'], ['나'], ['나']]
+    assert [player['name'] for player in failed] == ['가', '나']
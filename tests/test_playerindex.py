@@ -0,0 +1,31 @@
+from kbhughscrap.playerindex import attach_player_ids, load_player_index, lookup_player_ids, remember_player_ids, update_index_from_players
+
+
+def _index(tmp_path):
+    index = load_player_index(str(tmp_path / "index.json"))
+    remember_player_ids(index, '선수', '모의고', '1000', '100000')
+    return index
+
+
+def test_stale_entry_is_dropped_when_dropdown_fails(tmp_path):
+    index = _index(tmp_path)
+    player = {'name': '선수', 'school': '모의고', 'position': '투수', 'stale_ids': ('1000', '100000')}
+    assert update_index_from_players(index, [player]) == 1
+    assert lookup_player_ids(index, '선수', '모의고') == (None, None)
+    assert 'stale_ids' not in player
+
+
+def test_stale_entry_is_not_readded_with_same_ids(tmp_path):
+    index = _index(tmp_path)
+    player = {'name': '선수', 'school': '모의고', 'position': '투수', 'club_idx': '1000', 'person_no': '100000',
+              'stale_ids': ('1000', '100000')}
+    update_index_from_players(index, [player])
+    assert attach_player_ids([{'name': '선수', 'school': '모의고'}], index) == 0
+
+
+def test_stale_entry_is_replaced_by_new_dropdown_ids(tmp_path):
+    index = _index(tmp_path)
+    player = {'name': '선수', 'school': '모의고', 'position': '투수', 'club_idx': '1000', 'person_no': '100777',
+              'stale_ids': ('1000', '100000')}
+    assert update_index_from_players(index, [player]) == 1
+    assert lookup_player_ids(index, '선수', '모의고') == ('1000', '100777')
@@ -0,0 +1,42 @@
+import pytest
+
+from kbhughscrap.playertext import SAMPLE_INPUT, iter_roster_players, load_roster, roster_dataframe
+
+EDGE_LINES = """
+이름 학교 투수
+x y, 투수
+권동진 (세광고-원광대 내야수)
+이름 (학교, 포수)
+이름 (, 투수)
+이름 (학교,)
+이름 (학교 투수
+이름 (학교   이름고    외야수)
+이름 (학교1 - 학교2, 투수)
+이름 (한단어)
+두 단어
+3 →
+이름 서울 고 포수
+"""
+
+
+@pytest.mark.parametrize('text', [SAMPLE_INPUT, EDGE_LINES], ids=['sample', 'edge'])
+def test_roster_dataframe_matches_iterator(text):
+    expected = list(iter_roster_players(text))
+    frame = roster_dataframe(text)
+    assert frame.to_dict('records') == expected
+
+
+def test_unparenthesised_comma_line_keeps_comma_in_school():
+    player, = iter_roster_players("x y, 투수")
+    assert (player['school'], player['position']) == ('y,', '투수')
+    assert roster_dataframe("x y, 투수").loc[0, 'school'] == 'y,'
+
+
+def test_load_roster_warns_on_stderr(tmp_path, capsys):
+    path = tmp_path / "roster.txt"
+    path.write_text("김진욱 (강릉고 투수)\nbad\n", encoding='utf-8')
+    players = load_roster(str(path))
+    assert [player['name'] for player in players] == ['김진욱']
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "'bad'" in captured.err
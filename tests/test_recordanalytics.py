@@ -0,0 +1,31 @@
+import pandas as pd
+
+from kbhughscrap.recordanalytics import add_percentiles, rank_players
+
+
+def _frame():
+    return pd.DataFrame({
+        'name': ['투1', '투2', '타1', '타2'],
+        'school': ['모의고'] * 4,
+        'position': pd.Categorical(['투수', '투수', '타자', '타자']),
+        '볼넷': [30, 10, 5, 20],
+        '삼진': [50, 90, 40, 10],
+    })
+
+
+def test_rank_direction_depends_on_position():
+    walks = rank_players(_frame(), '볼넷')
+    first = walks[walks['rank'] == 1].set_index('position')['name']
+    assert first['투수'] == '투2'  # 볼넷을 적게 내준 투수가 1위
+    assert first['타자'] == '타2'  # 볼넷을 많이 얻은 타자가 1위
+
+    strikeouts = rank_players(_frame(), '삼진')
+    first = strikeouts[strikeouts['rank'] == 1].set_index('position')['name']
+    assert first['투수'] == '투2'
+    assert first['타자'] == '타2'  # 삼진이 적은 타자가 1위
+
+
+def test_percentile_best_is_one():
+    out = add_percentiles(_frame(), ['볼넷']).set_index('name')['볼넷_pct']
+    assert out['투2'] == 1.0 and out['투1'] == 0.5
+    assert out['타2'] == 1.0 and out['타1'] == 0.5
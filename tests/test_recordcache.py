@@ -0,0 +1,34 @@
+import json
+import os
+
+from kbhughscrap.recordcache import _cache_path, cache_key, get_cached_record, put_cached_record, scrape_with_cache
+
+PLAYER = {'name': '선수', 'school': '모의고', 'position': '투수'}
+HTML = "<div id='Record'>기록</div>"
+
+
+def test_corrupted_entry_is_a_miss(tmp_path):
+    put_cached_record(PLAYER, '2020', '2025', HTML, str(tmp_path))
+    assert get_cached_record(PLAYER, '2020', '2025', str(tmp_path)) == (HTML, True)
+
+    path = _cache_path(str(tmp_path), cache_key(PLAYER, '2020', '2025'))
+    with open(path, encoding='utf-8') as f:
+        entry = json.load(f)
+    entry['html'] = HTML[:-3]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entry, f)
+    assert get_cached_record(PLAYER, '2020', '2025', str(tmp_path)) == (None, False)
+
+
+def test_cache_only_run_enforces_max_bytes(tmp_path):
+    players = [dict(PLAYER, name=f"선수{i}") for i in range(3)]
+    for player in players:
+        put_cached_record(player, '2020', '2025', HTML, str(tmp_path))
+
+    def fetch(player_list, base_url, on_result):
+        raise AssertionError("캐시 전용 모드에서는 수집하지 않음")
+
+    url = "http://x/record?begin_year=2020&end_year=2025"
+    scrape_with_cache(players, url, fetch, cache_dir=str(tmp_path), max_bytes=1, cache_only=True)
+    remaining = sum(len(files) for _, _, files in os.walk(tmp_path))
+    assert remaining == 0
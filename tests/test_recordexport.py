@@ -0,0 +1,25 @@
+from kbhughscrap.recordexport import SHEET_NAME_MAX, unique_sheet_name
+
+
+def test_invalid_characters_are_replaced():
+    assert unique_sheet_name("a/b:c?[d]", set()) == "a_b_c__d_"
+
+
+def test_truncated_duplicates_get_suffix():
+    used = set()
+    long_name = "가" * 40
+    first = unique_sheet_name(long_name, used)
+    second = unique_sheet_name(long_name, used)
+    assert first == "가" * SHEET_NAME_MAX
+    assert second == "가" * (SHEET_NAME_MAX - 4) + " (2)"
+    assert len(second) == SHEET_NAME_MAX
+
+
+def test_names_compare_case_insensitively():
+    used = set()
+    assert unique_sheet_name("Kim", used) == "Kim"
+    assert unique_sheet_name("KIM", used) == "KIM (2)"
+
+
+def test_empty_name_falls_back():
+    assert unique_sheet_name("''", set()) == "시트"
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+from mockserver import mock_players, render_record_section, start_mock_server
+from kbhughscrap.recordfetch import fetch_player_stats
+from kbhughscrap.recordparse import NO_DATA_HTML, parse_record_html, player_key
+
+
+@pytest.fixture
+def mock_site():
+    server, base_url = start_mock_server(num_players=4)
+    yield base_url
+    server.shutdown()
+
+
+def test_import_does_not_load_selenium():
+    code = "import sys, kbhughscrap.recordfetch; sys.exit('selenium' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+
+def test_fetch_extracts_position_section(mock_site):
+    players = mock_players(4)
+    results = fetch_player_stats(players, mock_site)
+    assert list(results) == [player_key(player) for player in players]
+    for player in players:
+        expected = render_record_section(player['person_no'], player['position'], 2020, 2025)
+        assert parse_record_html(results[player_key(player)]) == parse_record_html(expected)
+        assert 'error' not in player
+
+
+def test_missing_ids_is_permanent_failure(mock_site):
+    player = {'name': '없는선수', 'school': '모의000고', 'position': '투수'}
+    results = fetch_player_stats([player], mock_site)
+    assert results == {player_key(player): NO_DATA_HTML}
+    assert player['error'] == "club_idx/person_no 없음"
+    assert player['retry'] is False
+
+
+def test_on_result_error_does_not_cancel_batch(mock_site):
+    players = mock_players(4)
+    reported = []
+
+    def on_result(player, record_html):
+        if player is players[0]:
+            raise RuntimeError("저장 실패")
+        reported.append(player_key(player))
+
+    fetch_player_stats(players, mock_site, on_result=on_result)
+    assert sorted(reported) == sorted(player_key(player) for player in players[1:])
@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+from kbhughscrap.recordstore import (
+    merge_season_rows, open_record_store, plan_incremental_refresh, store_summary, write_player_record,
+)
+
+HEADERS = ('연도', '팀명', '승')
+
+
+def _rows(*seasons):
+    return [(season, '모의고', str(wins)) for season, wins in seasons]
+
+
+@pytest.fixture
+def conn():
+    conn = open_record_store(':memory:')
+    yield conn
+    conn.close()
+
+
+def _player(**extra):
+    return {'name': '선수', 'school': '모의고', 'position': '투수', 'club_idx': '1', 'person_no': '2', **extra}
+
+
+# --- merge_season_rows ---
+def test_merge_replaces_years_in_range():
+    old = _rows(('2023', 5), ('2024', 4), ('2025', 1))
+    new = _rows(('2025', 3))
+    merged = merge_season_rows(old, new, 0, '2025', '2025')
+    assert merged == _rows(('2023', 5), ('2024', 4), ('2025', 3))
+
+
+def test_merge_drops_stored_years_missing_from_requested_range():
+    old = _rows(('2024', 4), ('2025', 1))
+    merged = merge_season_rows(old, _rows(('2024', 6)), 0, '2024', '2025')
+    assert merged == _rows(('2024', 6))
+
+
+def test_merge_keeps_stored_career_total():
+    old = _rows(('2023', 5), ('2024', 4), ('2025', 4), ('통산', 13))
+    new = _rows(('2025', 3), ('통산', 3))
+    merged = merge_season_rows(old, new, 0, '2025', '2025')
+    assert merged == _rows(('2023', 5), ('2024', 4), ('2025', 3), ('통산', 13))
+
+
+def test_merge_ignores_partial_total_when_none_stored():
+    merged = merge_season_rows(_rows(('2024', 4)), _rows(('2025', 3), ('통산', 3)), 0, '2025', '2025')
+    assert merged == _rows(('2024', 4), ('2025', 3))
+
+
+# --- plan_incremental_refresh ---
+def _store(conn, rows, begin_year='2020', end_year='2024', updated_at=None):
+    record = {'name': '선수', 'school': '모의고', 'position': '투수', 'headers': HEADERS, 'rows': rows}
+    write_player_record(conn, record, begin_year, end_year)
+    if updated_at is not None:
+        conn.execute("UPDATE players SET updated_at = ?", (updated_at,))
+
+
+def test_plan_fetches_unknown_player_in_full(conn):
+    player = _player()
+    assert plan_incremental_refresh(conn, [player], '2020', '2025') == [player]
+    assert 'incremental' not in player
+
+
+def test_plan_requests_only_open_seasons(conn):
+    _store(conn, _rows(('2023', 5), ('2024', 4)), updated_at=time.mktime((2025, 3, 1, 0, 0, 0, 0, 0, -1)))
+    player = _player()
+    assert plan_incremental_refresh(conn, [player], '2020', '2025') == [player]
+    assert (player['begin_year'], player['end_year'], player['incremental']) == ('2025', '2025', True)
+
+
+def test_plan_skips_player_with_only_closed_seasons(conn):
+    _store(conn, _rows(('2024', 4)), end_year='2024', updated_at=time.mktime((2025, 3, 1, 0, 0, 0, 0, 0, -1)))
+    assert plan_incremental_refresh(conn, [_player()], '2020', '2024') == []
+
+
+def test_plan_refetches_full_range_when_total_row_stored(conn):
+    _store(conn, _rows(('2024', 4), ('통산', 4)), begin_year='2018',
+           updated_at=time.mktime((2025, 3, 1, 0, 0, 0, 0, 0, -1)))
+    player = _player()
+    assert plan_incremental_refresh(conn, [player], '2020', '2025') == [player]
+    assert (player['begin_year'], player['end_year']) == ('2018', '2025')
+    assert 'incremental' not in player
+
+
+# --- store_summary ---
+def test_summary_season_range_ignores_total_rows(conn):
+    _store(conn, _rows(('2023', 5), ('2024', 4), ('통산', 9)))
+    summary = store_summary(conn)
+    assert (summary['first_season'], summary['last_season']) == ('2023', '2024')
+    assert summary['players'] == 1 and summary['rows'] == 3
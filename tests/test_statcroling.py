@@ -0,0 +1,24 @@
+import pytest
+
+from kbhughscrap import statcroling
+
+
+class FakeDriver:
+    quit_calls = 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def test_driver_quits_when_on_result_fails(monkeypatch):
+    driver = FakeDriver()
+    monkeypatch.setattr(statcroling, 'create_driver', lambda headless: (driver, None))
+    monkeypatch.setattr(statcroling, 'scrape_record_html', lambda *args: "<div>기록</div>")
+
+    def on_result(player, record_html):
+        raise RuntimeError("저장 실패")
+
+    players = [{'name': '선수', 'school': '모의고', 'position': '투수'}]
+    with pytest.raises(RuntimeError):
+        statcroling.scrape_player_stats(players, "http://localhost/", on_result=on_result)
+    assert driver.quit_calls == 1
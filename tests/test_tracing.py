@@ -0,0 +1,21 @@
+from kbhughscrap.tracing import STAGE_PARSE, print_trace_summary, record_player_time, reset_traces, span
+from kbhughscrap.waitengine import latency_report, record_latency
+
+
+def test_spans_and_waits_share_one_report(capsys):
+    reset_traces()
+    with span(STAGE_PARSE):
+        pass
+    record_latency("기록 섹션 대기", 0.2)
+    record_player_time({'name': '선수', 'school': '모의고', 'position': '투수'}, 1.5, True)
+
+    report = latency_report()
+    assert report[STAGE_PARSE]['count'] == 1
+    assert report["기록 섹션 대기"]['count'] == 1
+
+    print_trace_summary()
+    text = capsys.readouterr().out
+    assert text.count("=== 단계별 소요 시간 ===") == 1
+    assert STAGE_PARSE in text and "기록 섹션 대기" in text and "선수 (모의고, 투수)" in text
+    reset_traces()
+    assert latency_report() == {}